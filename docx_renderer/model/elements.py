@@ -1,8 +1,48 @@
 """In-memory representation of parsed document content and layout."""
 from __future__ import annotations
 
+import base64
+import itertools
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+
+class FrozenProperties(dict):
+    """Read-only property dict shared between elements and styles.
+
+    A ``dict`` subclass so lookups stay at C speed, with every mutating method
+    disabled. Unlike ``types.MappingProxyType`` it pickles, which the model
+    cache relies on.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: object, **kwargs: object) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+    def __reduce__(self):
+        return (frozen_properties, (dict(self),))
+
+
+def frozen_properties(data: Mapping[str, object]) -> Mapping[str, object]:
+    """Return a read-only copy of ``data``; empty input gives ``EMPTY_PROPERTIES``."""
+    return FrozenProperties(data) if data else EMPTY_PROPERTIES
+
+
+# Most runs and paragraphs carry no direct formatting. They all share this
+# read-only mapping instead of allocating an empty dict each; code that needs
+# to add entries must build its own dict.
+EMPTY_PROPERTIES: Mapping[str, object] = FrozenProperties()
+
+
+def _empty_properties() -> Mapping[str, object]:
+    return EMPTY_PROPERTIES
 
 
 @dataclass(slots=True)
@@ -11,8 +51,8 @@ class RunFragment:
 
     text: str
     style_id: Optional[str] = None
-    properties: Dict[str, object] = field(default_factory=dict)
-    controls: List[Dict[str, object]] = field(default_factory=list)
+    properties: Mapping[str, object] = field(default_factory=_empty_properties)
+    controls: Sequence[Dict[str, object]] = ()
     drawing: Optional["DrawingReference"] = None
     footnote_reference: Optional[int] = None
     endnote_reference: Optional[int] = None
@@ -28,10 +68,10 @@ class ParagraphElement:
 
     runs: List[RunFragment]
     style_id: Optional[str]
-    properties: Dict[str, object] = field(default_factory=dict)
+    properties: Mapping[str, object] = field(default_factory=_empty_properties)
     numbering: Optional["NumberingInfo"] = None
-    bookmarks: List["Bookmark"] = field(default_factory=list)
-    annotations: Dict[str, object] = field(default_factory=dict)
+    bookmarks: Sequence["Bookmark"] = ()
+    annotations: Mapping[str, object] = field(default_factory=_empty_properties)
 
 
 @dataclass(slots=True)
@@ -39,7 +79,7 @@ class TableCell:
     """Single table cell container."""
 
     content: List["BlockElement"]
-    properties: Dict[str, object] = field(default_factory=dict)
+    properties: Mapping[str, object] = field(default_factory=_empty_properties)
 
 
 @dataclass(slots=True)
@@ -47,7 +87,7 @@ class TableRow:
     """Row with a sequence of cells."""
 
     cells: List[TableCell]
-    properties: Dict[str, object] = field(default_factory=dict)
+    properties: Mapping[str, object] = field(default_factory=_empty_properties)
 
 
 @dataclass(slots=True)
@@ -56,7 +96,7 @@ class TableElement:
 
     rows: List[TableRow]
     style_id: Optional[str]
-    properties: Dict[str, object] = field(default_factory=dict)
+    properties: Mapping[str, object] = field(default_factory=_empty_properties)
 
 
 @dataclass(slots=True)
@@ -67,7 +107,8 @@ class ImageElement:
     media_path: str
     width_emu: Optional[int] = None
     height_emu: Optional[int] = None
-    properties: Dict[str, object] = field(default_factory=dict)
+    properties: Mapping[str, object] = field(default_factory=_empty_properties)
+    # Eager on purpose, like DrawingReference.data.
     data: Optional[bytes] = None
 
 
@@ -81,6 +122,8 @@ class DrawingReference:
     width_emu: Optional[int]
     height_emu: Optional[int]
     inline: bool
+    # Read while the package is still open, since renderers embed it after the
+    # archive has closed. The bytes object is shared with the media catalog.
     data: Optional[bytes] = None
 
 
@@ -175,14 +218,17 @@ class DocumentTree:
 
     sections: List[DocumentSection] = field(default_factory=list)
     metadata: Dict[str, object] = field(default_factory=dict)
+    _blocks_cache: Optional[List[BlockElement]] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def blocks(self) -> List[BlockElement]:
-        """Backward compatibility: return all blocks from all sections."""
-        all_blocks = []
-        for section in self.sections:
-            all_blocks.extend(section.blocks)
-        return all_blocks
+        """Backward compatibility: return all blocks from all sections.
+
+        The flattened list is built once and shared; treat it as read-only.
+        """
+        if self._blocks_cache is None:
+            self._blocks_cache = list(itertools.chain.from_iterable(section.blocks for section in self.sections))
+        return self._blocks_cache
 
 
 @dataclass(slots=True)
@@ -192,7 +238,21 @@ class MediaAsset:
     relationship_id: str
     target_path: str
     media_type: str
-    binary_data: bytes
-    base64_data: str
     size: int
     metadata: Dict[str, object] = field(default_factory=dict)
+    # Returns the payload for a target path; media is read on first access.
+    _read: Optional[Callable[[str], Optional[bytes]]] = field(default=None, repr=False, compare=False)
+    _base64_data: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def binary_data(self) -> bytes:
+        """Payload of ``target_path``, read from the package on first access."""
+        data = self._read(self.target_path) if self._read is not None else None
+        return data if data is not None else b""
+
+    @property
+    def base64_data(self) -> str:
+        """Base64 text of ``binary_data``, encoded on first access."""
+        if self._base64_data is None:
+            self._base64_data = base64.b64encode(self.binary_data).decode("ascii")
+        return self._base64_data
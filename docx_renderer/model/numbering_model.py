@@ -58,11 +58,8 @@ class NumberingCatalog:
     instances: Dict[int, NumberingInstance]
 
     def get_abstract(self, abstract_num_id: Optional[int]) -> Optional[AbstractNumberingDefinition]:
-        if abstract_num_id is None:
-            return None
+        # Keys are ints, so a None id simply misses.
         return self.abstracts.get(abstract_num_id)
 
     def get_instance(self, num_id: Optional[int]) -> Optional[NumberingInstance]:
-        if num_id is None:
-            return None
         return self.instances.get(num_id)
@@ -1,8 +1,11 @@
 """Style model captures Word style definitions in a normalized form."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Mapping, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from docx_renderer.model.elements import EMPTY_PROPERTIES
 
 
 @dataclass(slots=True)
@@ -12,7 +15,7 @@ class StyleDefinition:
     style_id: str
     style_type: str
     name: Optional[str]
-    properties: Dict[str, object] = field(default_factory=dict)
+    properties: Mapping[str, object] = field(default_factory=lambda: EMPTY_PROPERTIES)
     based_on: Optional[str] = None
     next_style: Optional[str] = None
     linked_style: Optional[str] = None
@@ -25,13 +28,21 @@ class StyleDefinition:
 class StylesCatalog:
     """Collection of resolved styles keyed by identifier."""
 
+    __slots__ = ("_styles", "_default_by_type", "_by_type")
+
     def __init__(self, styles: Mapping[str, StyleDefinition]):
-        self._styles = dict(styles)
+        self._styles = {sys.intern(style_id): style for style_id, style in styles.items()}
+        self._default_by_type: Dict[str, StyleDefinition] = {}
+        self._by_type: Dict[str, List[StyleDefinition]] = {}
+        for style in self._styles.values():
+            self._by_type.setdefault(style.style_type, []).append(style)
+            if style.is_default:
+                # First default wins, matching the previous linear scan.
+                self._default_by_type.setdefault(style.style_type, style)
 
     def get(self, style_id: Optional[str]) -> Optional[StyleDefinition]:
         """Return the resolved style definition given its identifier."""
-        if style_id is None:
-            return None
+        # Keys are style id strings, so a None id simply misses.
         return self._styles.get(style_id)
 
     def all(self) -> Mapping[str, StyleDefinition]:
@@ -40,7 +51,8 @@ class StylesCatalog:
 
     def default_for(self, style_type: str) -> Optional[StyleDefinition]:
         """Return the default style for the given style type if defined."""
-        for style in self._styles.values():
-            if style.style_type == style_type and style.is_default:
-                return style
-        return None
+        return self._default_by_type.get(style_type)
+
+    def of_type(self, style_type: str) -> Sequence[StyleDefinition]:
+        """Return all styles of the given type in catalog order."""
+        return tuple(self._by_type.get(style_type, ()))
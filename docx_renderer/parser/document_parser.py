@@ -1,13 +1,15 @@
 """Parse document.xml into structured content blocks."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
-from xml.etree import ElementTree as ET
+import sys
+from types import MappingProxyType
+from typing import Dict, Hashable, List, Mapping, Optional
 
 from docx_renderer.model.elements import (
     BlockElement,
     Bookmark,
     DocumentTree,
+    EMPTY_PROPERTIES,
     DrawingReference,
     ImageElement,
     NumberingInfo,
@@ -16,113 +18,190 @@ from docx_renderer.model.elements import (
     TableCell,
     TableElement,
     TableRow,
+    frozen_properties,
 )
 from docx_renderer.model.numbering_model import NumberingCatalog
 from docx_renderer.model.style_model import StylesCatalog
 from docx_renderer.parser.docx_loader import DocxPackage
-from docx_renderer.parser.media_extractor import MediaResolver
+from docx_renderer.parser.media_extractor import MediaParts, MediaResolver
+from docx_renderer.parser.rels_parser import MAIN_DOCUMENT_PART, WORD_REL_NS
+from docx_renderer.parser.section_parser import SectionParser
 from docx_renderer.utils.logger import get_logger
-from docx_renderer.utils.xml_utils import Namespaces
+from docx_renderer.utils.xml_utils import ET, Namespaces, compile_find, element_key, serialize_element
 
 LOGGER = get_logger(__name__)
 
+_FIND_INLINE = compile_find(".//wp:inline", Namespaces.DRAWING)
+_FIND_ANCHOR = compile_find(".//wp:anchor", Namespaces.DRAWING)
+_FIND_EXTENT = compile_find(".//wp:extent", Namespaces.DRAWING)
+_FIND_DOC_PR = compile_find(".//wp:docPr", Namespaces.DRAWING)
+_FIND_BLIP = compile_find(".//a:blip", Namespaces.DRAWING)
+
+_NO_HYPERLINK: Mapping[str, Optional[str]] = MappingProxyType({})
+
+# Clark-notation names, so the hot loops compare tags directly instead of
+# splitting off the namespace or resolving prefixes on every element.
+_NSMAP = Namespaces.WORD
+_W = f"{{{_NSMAP['w']}}}"
+_TAG_P = _W + "p"
+_TAG_R = _W + "r"
+_TAG_T = _W + "t"
+_TAG_TAB = _W + "tab"
+_TAG_BR = _W + "br"
+_TAG_CR = _W + "cr"
+_TAG_TBL = _W + "tbl"
+_TAG_TR = _W + "tr"
+_TAG_TC = _W + "tc"
+_TAG_PPR = _W + "pPr"
+_TAG_RPR = _W + "rPr"
+_TAG_TBLPR = _W + "tblPr"
+_TAG_TRPR = _W + "trPr"
+_TAG_TCPR = _W + "tcPr"
+_TAG_SECTPR = _W + "sectPr"
+_TAG_PSTYLE = _W + "pStyle"
+_TAG_TBLSTYLE = _W + "tblStyle"
+_TAG_NUMPR = _W + "numPr"
+_TAG_NUMID = _W + "numId"
+_TAG_ILVL = _W + "ilvl"
+_TAG_VMERGE = _W + "vMerge"
+_TAG_HYPERLINK = _W + "hyperlink"
+_TAG_BOOKMARK_START = _W + "bookmarkStart"
+_TAG_DRAWING = _W + "drawing"
+_TAG_FLDCHAR = _W + "fldChar"
+_TAG_INSTRTEXT = _W + "instrText"
+_TAG_FOOTNOTE_REF = _W + "footnoteReference"
+_TAG_ENDNOTE_REF = _W + "endnoteReference"
+_ATTR_VAL = _W + "val"
+_ATTR_ID = _W + "id"
+
+_IGNORED_PARAGRAPH_CHILDREN = frozenset(_W + name for name in ("pPr", "sectPr", "bookmarkEnd"))
+_IGNORED_RUN_CHILDREN = frozenset(
+    _W + name for name in ("rPr", "noBreakHyphen", "softHyphen", "lastRenderedPageBreak")
+)
+
+_QUALIFIED_NAMES: Dict[str, str] = {}
+
 
 class DocumentParser:
     """Transforms Word body XML into model elements."""
 
-    def __init__(self, package: DocxPackage, styles: StylesCatalog, numbering: NumberingCatalog) -> None:
+    def __init__(
+        self,
+        package: DocxPackage,
+        styles: StylesCatalog,
+        numbering: NumberingCatalog,
+        media_parts: Optional[MediaParts] = None,
+    ) -> None:
         self._package = package
         self._styles = styles
         self._numbering = numbering
-        self._media = MediaResolver(package.relationships, package.media)
+        self._media = MediaResolver(package.relationships, package, media_parts)
+        self._sections = SectionParser(package, styles, numbering)
+        # Body hyperlinks and drawings only reference document.xml relationships.
+        self._doc_rels = package.relationships.for_part(MAIN_DOCUMENT_PART)
+        # Runs and paragraphs mostly repeat a handful of formatting blocks;
+        # identical blocks share one serialized, read-only mapping.
+        self._shared_properties: Dict[Hashable, Mapping[str, object]] = {}
 
     def parse(self) -> DocumentTree:
         """Parse the document body into high-level block elements."""
-        document_tree = self._package.require_document_xml()
-        root = document_tree.getroot()
-        body = root.find("w:body", Namespaces.WORD)
+        body = self._package.iter_document_body()
         if body is None:
             LOGGER.warning("document.xml missing body element")
             return DocumentTree(sections=[])
 
         blocks = []
-        for child in list(body):
-            tag = self._strip_namespace(child.tag)
-            if tag == "p":
+        final_sect_pr: Optional[ET.Element] = None
+        for child in body:
+            tag = child.tag
+            if tag == _TAG_P:
                 blocks.append(self._parse_paragraph(child))
-            elif tag == "tbl":
+            elif tag == _TAG_TBL:
                 blocks.append(self._parse_table(child))
-            elif tag == "sectPr":
-                # Section properties influence layout; stored as metadata later.
-                continue
+            elif tag == _TAG_SECTPR:
+                # Kept for the final section; body children are discarded as we go.
+                final_sect_pr = child
             else:
-                LOGGER.debug("Skipping unsupported element: %s", tag)
+                LOGGER.debug("Skipping unsupported element: %s", self._strip_namespace(tag))
         
         # Parse sections with headers/footers
-        from docx_renderer.parser.section_parser import SectionParser
-        section_parser = SectionParser(self._package, self._styles, self._numbering)
-        return section_parser.parse_sections(blocks)
+        return self._sections.build_sections(blocks, final_sect_pr)
 
     def _parse_paragraph(self, paragraph_el: ET.Element) -> ParagraphElement:
         runs: List[RunFragment] = []
         bookmarks: List[Bookmark] = []
         
-        # Parse paragraph-level properties
-        paragraph_props = self._extract_paragraph_properties(paragraph_el)
-        numbering = self._extract_numbering_info(paragraph_el)
-        style_id = self._get_style_id(paragraph_el)
+        # Parse paragraph-level properties; pPr is looked up once and shared
+        ppr = paragraph_el.find(_TAG_PPR)
+        if ppr is None:
+            paragraph_props, numbering, style_id = EMPTY_PROPERTIES, None, None
+        elif len(ppr) == 1 and ppr[0].tag == _TAG_PSTYLE:
+            # A bare style reference carries nothing beyond the style id.
+            style_id = ppr[0].attrib.get(_ATTR_VAL)
+            style_id = sys.intern(style_id) if style_id is not None else None
+            paragraph_props, numbering = EMPTY_PROPERTIES, None
+        else:
+            paragraph_props = self._extract_paragraph_properties(ppr)
+            numbering = self._extract_numbering_info(ppr)
+            style_id = self._get_style_id(ppr)
         
         # Process all child elements in order to maintain document flow
-        for child in list(paragraph_el):
-            tag = self._strip_namespace(child.tag)
+        for child in paragraph_el:
+            tag = child.tag
             
-            if tag == "r":  # Run element
+            if tag == _TAG_R:  # Run element
                 runs.extend(self._parse_run(child))
-            elif tag == "bookmarkStart":
+            elif tag == _TAG_BOOKMARK_START:
                 bookmark = self._parse_bookmark_start(child)
                 if bookmark:
                     bookmarks.append(bookmark)
-            elif tag == "hyperlink":
+            elif tag == _TAG_HYPERLINK:
                 runs.extend(self._parse_hyperlink(child))
-            elif tag in ["pPr", "sectPr", "bookmarkEnd"]:
+            elif tag in _IGNORED_PARAGRAPH_CHILDREN:
                 # Already processed or not needed in runs
                 continue
             else:
-                LOGGER.debug("Skipping paragraph child element: %s", tag)
+                LOGGER.debug("Skipping paragraph child element: %s", self._strip_namespace(tag))
         
         return ParagraphElement(
             runs=runs,
             style_id=style_id,
             properties=paragraph_props,
             numbering=numbering,
-            bookmarks=bookmarks,
+            bookmarks=bookmarks or (),
         )
 
     def _parse_table(self, table_el: ET.Element) -> TableElement:
         rows: List[TableRow] = []
-        table_props = self._extract_table_properties(table_el)
-        style_id = self._get_table_style_id(table_el)
+        tbl_pr = table_el.find(_TAG_TBLPR)
+        table_props = self._extract_table_properties(tbl_pr)
+        style_id = self._get_table_style_id(tbl_pr)
         
-        for row_el in table_el.findall("w:tr", Namespaces.WORD):
+        for row_el in table_el:
+            if row_el.tag != _TAG_TR:
+                continue
             cells: List[TableCell] = []
             row_props = self._extract_row_properties(row_el)
             
-            for cell_el in row_el.findall("w:tc", Namespaces.WORD):
+            for cell_el in row_el:
+                if cell_el.tag != _TAG_TC:
+                    continue
                 cell_content: List[BlockElement] = []
                 cell_props = self._extract_cell_properties(cell_el)
-                vertical_merge = self._extract_vertical_merge(cell_el)
+                vertical_merge = self._extract_vertical_merge(cell_props)
                 
                 # Parse cell content (paragraphs, tables, etc.)
-                for child in list(cell_el):
-                    tag = self._strip_namespace(child.tag)
-                    if tag == "p":
+                for child in cell_el:
+                    tag = child.tag
+                    if tag == _TAG_P:
                         cell_content.append(self._parse_paragraph(child))
-                    elif tag == "tbl":
+                    elif tag == _TAG_TBL:
                         cell_content.append(self._parse_table(child))
-                    elif tag not in ["tcPr"]:  # Skip cell properties
-                        LOGGER.debug("Skipping cell child element: %s", tag)
+                    elif tag != _TAG_TCPR:  # Skip cell properties
+                        LOGGER.debug("Skipping cell child element: %s", self._strip_namespace(tag))
                 
                 if vertical_merge:
+                    # vMerge lives in tcPr, so cell_props is a private dict here.
                     cell_props["vMerge"] = vertical_merge
 
                 cells.append(TableCell(content=cell_content, properties=cell_props))
@@ -131,98 +210,109 @@ class DocumentParser:
         
         return TableElement(rows=rows, style_id=style_id, properties=table_props)
 
-    def _get_style_id(self, element: ET.Element) -> str | None:
-        ppr = element.find("w:pPr", Namespaces.WORD)
+    def _get_style_id(self, ppr: Optional[ET.Element]) -> str | None:
         if ppr is None:
             return None
-        style_el = ppr.find("w:pStyle", Namespaces.WORD)
+        style_el = ppr.find(_TAG_PSTYLE)
         if style_el is None:
             return None
-        attr_key = self._qualify("w:val")
-        return style_el.attrib.get(attr_key)
+        style_id = style_el.attrib.get(_ATTR_VAL)
+        return sys.intern(style_id) if style_id is not None else None
 
     def _strip_namespace(self, tag: str) -> str:
         return tag.split("}", 1)[-1]
 
     def _qualify(self, attr_name: str) -> str:
-        prefix, local = attr_name.split(":", 1)
-        namespace = Namespaces.WORD[prefix]
-        return f"{{{namespace}}}{local}"
+        qualified = _QUALIFIED_NAMES.get(attr_name)
+        if qualified is None:
+            prefix, local = attr_name.split(":", 1)
+            namespace = WORD_REL_NS if prefix == "r" else _NSMAP[prefix]
+            qualified = _QUALIFIED_NAMES[attr_name] = f"{{{namespace}}}{local}"
+        return qualified
 
     # ------------------------------------------------------------------
     # Enhanced parsing methods
     
-    def _parse_run(self, run_el: ET.Element) -> List[RunFragment]:
-        """Parse a run element, handling text, fields, drawings, etc."""
+    def _parse_run(
+        self, run_el: ET.Element, link: Mapping[str, Optional[str]] = _NO_HYPERLINK
+    ) -> List[RunFragment]:
+        """Parse a run element, handling text, fields, drawings, etc.
+
+        ``link`` carries hyperlink fields applied to every fragment at construction.
+        """
         fragments: List[RunFragment] = []
         run_props = self._extract_run_properties(run_el)
         
         # Collect text and special elements from the run
-        current_text = ""
+        text_parts: List[str] = []
         
-        for child in list(run_el):
-            tag = self._strip_namespace(child.tag)
+        for child in run_el:
+            tag = child.tag
             
-            if tag == "t":  # Text element
+            if tag == _TAG_T:  # Text element
                 if child.text:
-                    current_text += child.text
-            elif tag == "tab":  # Tab character
-                current_text += "\t"
-            elif tag == "br":  # Line break
-                current_text += "\n"
-            elif tag == "cr":  # Carriage return
-                current_text += "\r"
-            elif tag == "drawing":  # Drawing/image
+                    text_parts.append(child.text)
+            elif tag == _TAG_TAB:  # Tab character
+                text_parts.append("\t")
+            elif tag == _TAG_BR:  # Line break
+                text_parts.append("\n")
+            elif tag == _TAG_CR:  # Carriage return
+                text_parts.append("\r")
+            elif tag == _TAG_DRAWING:  # Drawing/image
                 # Flush current text
-                if current_text:
-                    fragments.append(RunFragment(text=current_text, properties=run_props))
-                    current_text = ""
+                if text_parts:
+                    fragments.append(RunFragment(text="".join(text_parts), properties=run_props, **link))
+                    text_parts.clear()
                 # Parse drawing
                 drawing = self._parse_drawing(child)
                 if drawing:
                     fragments.append(RunFragment(
                         text="",
                         properties=run_props,
-                        drawing=drawing
+                        drawing=drawing,
+                        **link,
                     ))
-            elif tag == "fldChar":  # Field character
+            elif tag == _TAG_FLDCHAR:  # Field character
                 field_type = self._get_attr(child, None, "w:fldCharType")
                 if field_type == "begin":
-                    current_text += "{"
+                    text_parts.append("{")
                 elif field_type == "end":
-                    current_text += "}"
-            elif tag == "instrText":  # Field instruction text
+                    text_parts.append("}")
+            elif tag == _TAG_INSTRTEXT:  # Field instruction text
                 if child.text:
                     fragments.append(RunFragment(
                         text="",
                         properties=run_props,
-                        field_code=child.text.strip()
+                        field_code=child.text.strip(),
+                        **link,
                     ))
-            elif tag == "footnoteReference":
-                footnote_id = self._get_int_attr(child, None, "w:id")
+            elif tag == _TAG_FOOTNOTE_REF:
+                footnote_id = self._get_int_attr(child, None, _ATTR_ID)
                 if footnote_id is not None:
                     fragments.append(RunFragment(
                         text="",
                         properties=run_props,
-                        footnote_reference=footnote_id
+                        footnote_reference=footnote_id,
+                        **link,
                     ))
-            elif tag == "endnoteReference":
-                endnote_id = self._get_int_attr(child, None, "w:id")
+            elif tag == _TAG_ENDNOTE_REF:
+                endnote_id = self._get_int_attr(child, None, _ATTR_ID)
                 if endnote_id is not None:
                     fragments.append(RunFragment(
                         text="",
                         properties=run_props,
-                        endnote_reference=endnote_id
+                        endnote_reference=endnote_id,
+                        **link,
                     ))
-            elif tag in ["rPr", "noBreakHyphen", "softHyphen", "lastRenderedPageBreak"]:
+            elif tag in _IGNORED_RUN_CHILDREN:
                 # Skip already processed or layout-only elements
                 continue
             else:
-                LOGGER.debug("Skipping run child element: %s", tag)
+                LOGGER.debug("Skipping run child element: %s", self._strip_namespace(tag))
         
         # Add final text fragment if any
-        if current_text or not fragments:
-            fragments.append(RunFragment(text=current_text, properties=run_props))
+        if text_parts or not fragments:
+            fragments.append(RunFragment(text="".join(text_parts), properties=run_props, **link))
         
         return fragments
 
@@ -235,30 +325,26 @@ class DocumentParser:
         # Resolve hyperlink target
         target = None
         if r_id:
-            rel = self._package.relationships.find("word/document.xml", r_id)
+            rel = self._doc_rels.get(r_id)
             if rel and rel.is_external:
                 target = rel.target
         
         # Parse runs within hyperlink
-        for run_el in hyperlink_el.findall("w:r", Namespaces.WORD):
-            run_fragments = self._parse_run(run_el)
-            for fragment in run_fragments:
-                fragment.hyperlink_id = r_id
-                fragment.hyperlink_anchor = anchor
-                fragment.hyperlink_target = target
-                fragments.append(fragment)
+        link = {"hyperlink_id": r_id, "hyperlink_anchor": anchor, "hyperlink_target": target}
+        for run_el in hyperlink_el.findall(_TAG_R):
+            fragments.extend(self._parse_run(run_el, link))
         
         return fragments
 
     def _parse_drawing(self, drawing_el: ET.Element) -> Optional[DrawingReference]:
         """Parse drawing element to extract image information."""
         # Try inline drawing first
-        inline = drawing_el.find(".//wp:inline", {"wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"})
+        inline = _FIND_INLINE(drawing_el)
         if inline is not None:
             return self._parse_inline_drawing(inline, True)
         
         # Try anchored drawing
-        anchor = drawing_el.find(".//wp:anchor", {"wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"})
+        anchor = _FIND_ANCHOR(drawing_el)
         if anchor is not None:
             return self._parse_inline_drawing(anchor, False)
         
@@ -267,27 +353,27 @@ class DocumentParser:
     def _parse_inline_drawing(self, drawing_el: ET.Element, is_inline: bool) -> Optional[DrawingReference]:
         """Parse inline or anchored drawing element."""
         # Extract dimensions
-        extent = drawing_el.find(".//wp:extent", {"wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"})
+        extent = _FIND_EXTENT(drawing_el)
         width_emu = self._get_int_attr(extent, None, "cx") if extent is not None else None
         height_emu = self._get_int_attr(extent, None, "cy") if extent is not None else None
         
         # Extract description
-        doc_pr = drawing_el.find(".//wp:docPr", {"wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"})
+        doc_pr = _FIND_DOC_PR(drawing_el)
         description = self._get_attr(doc_pr, None, "descr") if doc_pr is not None else None
         
         # Extract relationship ID for image
-        blip = drawing_el.find(".//a:blip", {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"})
+        blip = _FIND_BLIP(drawing_el)
         r_id = self._get_attr(blip, None, "r:embed") if blip is not None else None
         
         if not r_id:
             return None
         
         # Resolve image target
-        rel = self._package.relationships.find("word/document.xml", r_id)
+        rel = self._doc_rels.get(r_id)
         target = rel.resolved_target if rel else None
         
         # Get image data
-        data = self._media.resolve_image("word/document.xml", r_id)
+        data = self._media.resolve_image(MAIN_DOCUMENT_PART, r_id)
         
         return DrawingReference(
             r_id=r_id,
@@ -301,7 +387,7 @@ class DocumentParser:
 
     def _parse_bookmark_start(self, bookmark_el: ET.Element) -> Optional[Bookmark]:
         """Parse bookmark start element."""
-        bookmark_id = self._get_int_attr(bookmark_el, None, "w:id")
+        bookmark_id = self._get_int_attr(bookmark_el, None, _ATTR_ID)
         name = self._get_attr(bookmark_el, None, "w:name")
         
         if bookmark_id is not None and name:
@@ -311,70 +397,57 @@ class DocumentParser:
     # ------------------------------------------------------------------
     # Property extraction methods
     
-    def _extract_paragraph_properties(self, paragraph_el: ET.Element) -> Dict[str, object]:
-        """Extract paragraph-level properties."""
-        props = {}
-        ppr = paragraph_el.find("w:pPr", Namespaces.WORD)
-        if ppr is not None:
-            props = self._serialize_properties_block(ppr)
-        return props
-
-    def _extract_run_properties(self, run_el: ET.Element) -> Dict[str, object]:
+    def _extract_paragraph_properties(self, ppr: Optional[ET.Element]) -> Mapping[str, object]:
+        """Extract paragraph-level properties from a paragraph's pPr."""
+        if ppr is None:
+            return EMPTY_PROPERTIES
+        return self._serialize_shared_block(ppr)
+
+    def _extract_run_properties(self, run_el: ET.Element) -> Mapping[str, object]:
         """Extract run-level properties."""
-        props = {}
-        rpr = run_el.find("w:rPr", Namespaces.WORD)
-        if rpr is not None:
-            props = self._serialize_properties_block(rpr)
-        return props
-
-    def _extract_table_properties(self, table_el: ET.Element) -> Dict[str, object]:
-        """Extract table-level properties."""
-        props = {}
-        tbl_pr = table_el.find("w:tblPr", Namespaces.WORD)
-        if tbl_pr is not None:
-            props = self._serialize_properties_block(tbl_pr)
-        return props
-
-    def _extract_row_properties(self, row_el: ET.Element) -> Dict[str, object]:
+        rpr = run_el.find(_TAG_RPR)
+        if rpr is None:
+            return EMPTY_PROPERTIES
+        return self._serialize_shared_block(rpr)
+
+    def _extract_table_properties(self, tbl_pr: Optional[ET.Element]) -> Mapping[str, object]:
+        """Extract table-level properties from a table's tblPr."""
+        if tbl_pr is None:
+            return EMPTY_PROPERTIES
+        return self._serialize_properties_block(tbl_pr)
+
+    def _extract_row_properties(self, row_el: ET.Element) -> Mapping[str, object]:
         """Extract table row properties."""
-        props = {}
-        tr_pr = row_el.find("w:trPr", Namespaces.WORD)
-        if tr_pr is not None:
-            props = self._serialize_properties_block(tr_pr)
-        return props
+        tr_pr = row_el.find(_TAG_TRPR)
+        if tr_pr is None:
+            return EMPTY_PROPERTIES
+        return self._serialize_properties_block(tr_pr)
 
-    def _extract_cell_properties(self, cell_el: ET.Element) -> Dict[str, object]:
+    def _extract_cell_properties(self, cell_el: ET.Element) -> Mapping[str, object]:
         """Extract table cell properties."""
-        props = {}
-        tc_pr = cell_el.find("w:tcPr", Namespaces.WORD)
-        if tc_pr is not None:
-            props = self._serialize_properties_block(tc_pr)
-        return props
-
-    def _extract_vertical_merge(self, cell_el: ET.Element) -> Optional[Dict[str, object]]:
-        tc_pr = cell_el.find("w:tcPr", Namespaces.WORD)
+        tc_pr = cell_el.find(_TAG_TCPR)
         if tc_pr is None:
-            return None
-
-        vmerge_el = tc_pr.find("w:vMerge", Namespaces.WORD)
-        if vmerge_el is None:
-            return None
-
-        merged = self._serialize_node(vmerge_el)
-        return merged
+            return EMPTY_PROPERTIES
+        return self._serialize_properties_block(tc_pr)
+
+    def _extract_vertical_merge(self, cell_props: Mapping[str, object]) -> Optional[Dict[str, object]]:
+        """Return the vMerge node from the already-serialized tcPr, if any."""
+        for child in cell_props.get("children", ()):
+            if child["tag"] == _TAG_VMERGE:
+                return child
+        return None
 
-    def _extract_numbering_info(self, paragraph_el: ET.Element) -> Optional[NumberingInfo]:
+    def _extract_numbering_info(self, ppr: Optional[ET.Element]) -> Optional[NumberingInfo]:
         """Extract numbering information from paragraph properties."""
-        ppr = paragraph_el.find("w:pPr", Namespaces.WORD)
         if ppr is None:
             return None
         
-        num_pr = ppr.find("w:numPr", Namespaces.WORD)
+        num_pr = ppr.find(_TAG_NUMPR)
         if num_pr is None:
             return None
         
-        num_id = self._get_int_attr(num_pr, "w:numId", "w:val")
-        level = self._get_int_attr(num_pr, "w:ilvl", "w:val")
+        num_id = self._get_int_attr(num_pr, _TAG_NUMID, _ATTR_VAL)
+        level = self._get_int_attr(num_pr, _TAG_ILVL, _ATTR_VAL)
         
         if num_id is None or level is None:
             return None
@@ -405,35 +478,29 @@ class DocumentParser:
             alignment=level_def.alignment
         )
 
-    def _get_table_style_id(self, table_el: ET.Element) -> Optional[str]:
-        """Extract table style ID."""
-        tbl_pr = table_el.find("w:tblPr", Namespaces.WORD)
+    def _get_table_style_id(self, tbl_pr: Optional[ET.Element]) -> Optional[str]:
+        """Extract table style ID from a table's tblPr."""
         if tbl_pr is None:
             return None
-        style_el = tbl_pr.find("w:tblStyle", Namespaces.WORD)
+        style_el = tbl_pr.find(_TAG_TBLSTYLE)
         if style_el is None:
             return None
-        return self._get_attr(style_el, None, "w:val")
+        style_id = style_el.attrib.get(_ATTR_VAL)
+        return sys.intern(style_id) if style_id is not None else None
+
+    def _serialize_shared_block(self, element: ET.Element) -> Mapping[str, object]:
+        """Serialize a property block, reusing one read-only result for identical blocks."""
+        key = element_key(element)
+        data = self._shared_properties.get(key)
+        if data is None:
+            data = self._shared_properties[key] = frozen_properties(self._serialize_properties_block(element))
+        return data
 
     def _serialize_properties_block(self, element: ET.Element) -> Dict[str, object]:
         """Serialize property block while preserving structure."""
-        return {
-            "tag": element.tag,
-            "attributes": dict(element.attrib),
-            "children": [self._serialize_node(child) for child in list(element)]
-        }
-
-    def _serialize_node(self, node: ET.Element) -> Dict[str, object]:
-        """Serialize XML node to dictionary."""
-        data = {
-            "tag": node.tag,
-            "attributes": dict(node.attrib),
-        }
-        if node.text and node.text.strip():
-            data["text"] = node.text
-        children = [self._serialize_node(child) for child in list(node)]
-        if children:
-            data["children"] = children
+        data = serialize_element(element)
+        if "children" not in data:
+            data["children"] = []
         return data
 
     def _get_attr(self, element: Optional[ET.Element], child_name: Optional[str], attr_name: str) -> Optional[str]:
@@ -441,12 +508,12 @@ class DocumentParser:
         if element is None:
             return None
         
-        target = element.find(child_name, Namespaces.WORD) if child_name else element
+        target = element.find(child_name, _NSMAP) if child_name else element
         if target is None:
             return None
         
-        # Handle both qualified and unqualified attribute names
-        if ":" in attr_name:
+        # Handle prefixed ("w:val"), Clark-notation and unqualified attribute names
+        if ":" in attr_name and attr_name[0] != "{":
             attr_key = self._qualify(attr_name)
         else:
             attr_key = attr_name
@@ -1,15 +1,19 @@
 """DOCX package loader responsible for unpacking XML parts and media."""
 from __future__ import annotations
 
+import functools
+import io
+import os
+import sys
 import zipfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Mapping, Optional
-from xml.etree import ElementTree as ET
+from types import MappingProxyType
+from typing import BinaryIO, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from docx_renderer.parser.rels_parser import DocumentRelationshipSummary, Relationships
 from docx_renderer.utils.logger import get_logger
-from docx_renderer.utils.xml_utils import parse_xml
+from docx_renderer.utils.xml_utils import HAS_LXML, ET, Namespaces, iter_child_elements, parse_xml
 
 LOGGER = get_logger(__name__)
 
@@ -26,6 +30,62 @@ GLOSSARY_XML_PATH = "word/glossary/document.xml"
 CORE_PROPS_PATH = "docProps/core.xml"
 APP_PROPS_PATH = "docProps/app.xml"
 CUSTOM_PROPS_PATH = "docProps/custom.xml"
+MEDIA_PREFIX = "word/media/"
+
+BODY_TAG = f"{{{Namespaces.WORD['w']}}}body"
+
+CONTENT_TYPES_PATH = "[Content_Types].xml"
+REQUIRED_PARTS = (CONTENT_TYPES_PATH, DOCUMENT_XML_PATH, STYLES_XML_PATH)
+
+# XML parts are parsed on first access. These are the ones a conversion
+# always reads, so they may be parsed up front on a thread pool. document.xml
+# is not among them: the body is streamed by the document parser.
+EAGER_XML_PARTS = frozenset({STYLES_XML_PATH, NUMBERING_XML_PATH})
+# Parts with no meaningful text content, parsed without blank text nodes.
+STRUCTURAL_XML_PARTS = frozenset({CONTENT_TYPES_PATH, STYLES_XML_PATH, NUMBERING_XML_PATH})
+HEADER_PREFIX = "word/header"
+FOOTER_PREFIX = "word/footer"
+THEME_PREFIX = "word/theme/"
+# Families of numbered parts, grouped by name prefix in a single pass.
+PREFIXED_PART_FAMILIES = (HEADER_PREFIX, FOOTER_PREFIX, THEME_PREFIX)
+EAGER_XML_PREFIXES = (HEADER_PREFIX, FOOTER_PREFIX)
+# Below this many bytes of XML, thread start-up costs more than it saves.
+PARALLEL_PARSE_MIN_BYTES = 256 * 1024
+# Part stores kept by DocxPackage.load_cached.
+PACKAGE_CACHE_SIZE = 32
+
+
+class ArchiveParts(Mapping[str, bytes]):
+    """Read-only mapping of part names to bytes that decompresses on access.
+
+    Nothing is cached here: parsed trees live in ``DocxPackage.xml_cache``,
+    so at most one part's bytes are held at a time. Reads go through the
+    package's open archive and fail with ``ValueError`` once it is closed.
+    """
+
+    __slots__ = ("_archive", "_names")
+
+    def __init__(self, archive: zipfile.ZipFile, names: Iterable[str]) -> None:
+        self._archive = archive
+        self._names = dict.fromkeys(names)
+
+    def __getitem__(self, name: str) -> bytes:
+        if name not in self._names:
+            raise KeyError(name)
+        return self._archive.read(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def part_size(self, name: str) -> int:
+        """Uncompressed size of ``name`` from the zip directory, without reading it."""
+        return self._archive.getinfo(name).file_size
 
 
 @dataclass(slots=True)
@@ -33,106 +93,189 @@ class DocxPackage:
     """Container for the XML parts and media extracted from a DOCX archive."""
 
     raw_parts: Mapping[str, bytes]
+    # Every parsed part, keyed by part name; the *_xml accessors read from here.
     xml_cache: Dict[str, ET.ElementTree] = field(default_factory=dict)
 
-    content_types_xml: ET.ElementTree | None = None
-    package_rels_xml: ET.ElementTree | None = None
-
-    document_xml: ET.ElementTree | None = None
-    styles_xml: ET.ElementTree | None = None
-    numbering_xml: Optional[ET.ElementTree] = None
-    document_rels_xml: Optional[ET.ElementTree] = None
-    footnotes_xml: Optional[ET.ElementTree] = None
-    endnotes_xml: Optional[ET.ElementTree] = None
-    comments_xml: Optional[ET.ElementTree] = None
-    settings_xml: Optional[ET.ElementTree] = None
-    glossary_xml: Optional[ET.ElementTree] = None
-
-    core_properties_xml: Optional[ET.ElementTree] = None
-    app_properties_xml: Optional[ET.ElementTree] = None
-    custom_properties_xml: Optional[ET.ElementTree] = None
-
-    headers: Dict[str, ET.ElementTree] = field(default_factory=dict)
-    footers: Dict[str, ET.ElementTree] = field(default_factory=dict)
-    theme_parts: Dict[str, ET.ElementTree] = field(default_factory=dict)
-
     relationships: Relationships = field(init=False)
-    media: Dict[str, bytes] = field(default_factory=dict)
+    # Parts left in the archive opened from ``source_path``: media is read on
+    # first request and document.xml is streamed straight from the zip entry.
+    source_path: Optional[Path] = None
+    archive_parts: FrozenSet[str] = frozenset()
+    _archive: Optional[zipfile.ZipFile] = field(default=None, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+    _families: Optional[Dict[str, Tuple[str, ...]]] = field(default=None, init=False, repr=False)
 
     @classmethod
     def load(cls, docx_path: Path) -> "DocxPackage":
-        """Open a DOCX archive and populate XML trees and related assets."""
-        with zipfile.ZipFile(docx_path) as docx_zip:
-            parts = {name: docx_zip.read(name) for name in docx_zip.namelist()}
+        """Open a DOCX archive; parts are read and parsed as they are requested.
+
+        The archive stays open for deferred parts; use the package as a
+        context manager or call :meth:`close` when done with it.
+        """
+        docx_zip = zipfile.ZipFile(docx_path)
+        try:
+            # Part names recur as keys in xml_cache, relationships and media lookups.
+            names = [sys.intern(name) for name in docx_zip.namelist()]
+            archive_parts = frozenset(
+                name for name in names if name.startswith(MEDIA_PREFIX) or name == DOCUMENT_XML_PATH
+            )
+            LOGGER.debug("Opened %s with %d parts", docx_path.name, len(names))
 
-        LOGGER.debug("Loaded %d parts from %s", len(parts), docx_path.name)
+            package = cls(raw_parts={}, source_path=docx_path, archive_parts=archive_parts)
+            package._archive = docx_zip
+            # Every part is decompressed only when it is first read.
+            package.raw_parts = ArchiveParts(
+                docx_zip, (name for name in names if name not in archive_parts)
+            )
+            package._initialize_caches()
+        except BaseException:
+            docx_zip.close()
+            raise
+        return package
+
+    @classmethod
+    def load_cached(cls, docx_path: Path) -> "DocxPackage":
+        """Like :meth:`load`, but reuse the part bytes read for an unchanged file.
 
-        package = cls(raw_parts=parts)
+        Entries are keyed by resolved path, modification time and size, and
+        hold only a read-only mapping of every part's bytes; the file is not
+        touched again. Each call returns a new package with its own
+        ``xml_cache``, so callers never share parsed trees.
+        """
+        path = Path(docx_path).resolve()
+        stat = path.stat()
+        package = cls(raw_parts=_read_parts(path, stat.st_mtime_ns, stat.st_size), source_path=path)
         package._initialize_caches()
         return package
 
+    @staticmethod
+    def clear_load_cache() -> None:
+        """Drop every part store kept by :meth:`load_cached`."""
+        _read_parts.cache_clear()
+
+    def close(self) -> None:
+        """Release the archive handle; reading a deferred part afterwards raises ``ValueError``."""
+        self._closed = True
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def __enter__(self) -> "DocxPackage":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     # ------------------------------------------------------------------
     # Public helpers
+    @property
+    def document_xml(self) -> Optional[ET.ElementTree]:
+        """The document.xml DOM if :meth:`require_document_xml` has built it."""
+        return self.xml_cache.get(DOCUMENT_XML_PATH)
+
     def require_document_xml(self) -> ET.ElementTree:
-        if self.document_xml is None:
+        tree = self.xml_cache.get(DOCUMENT_XML_PATH)
+        if tree is None:
+            data = self.get_part_data(DOCUMENT_XML_PATH)
+            if data is None:
+                raise ValueError("Primary document part missing from package")
+            tree = self.xml_cache[DOCUMENT_XML_PATH] = parse_xml(data)
+        return tree
+
+    def iter_document_body(self) -> Optional[Iterator[ET.Element]]:
+        """Yield the children of ``w:body``, streaming when the DOM is not built.
+
+        Returns ``None`` when document.xml has no body element.
+        """
+        document_xml = self.xml_cache.get(DOCUMENT_XML_PATH)
+        if document_xml is not None:
+            body = document_xml.getroot().find("w:body", Namespaces.WORD)
+            return iter(body) if body is not None else None
+        stream = self._open_part(DOCUMENT_XML_PATH)
+        if stream is None:
             raise ValueError("Primary document part missing from package")
-        return self.document_xml
+        return iter_child_elements(stream, BODY_TAG)
 
     def require_styles_xml(self) -> ET.ElementTree:
-        if self.styles_xml is None:
+        styles_xml = self.styles_xml
+        if styles_xml is None:
             raise ValueError("Styles part missing from package")
-        return self.styles_xml
+        return styles_xml
 
     def get_numbering_xml(self) -> Optional[ET.ElementTree]:
         return self.numbering_xml
 
     def get_xml_part(self, name: str) -> Optional[ET.ElementTree]:
-        if name in self.xml_cache:
-            return self.xml_cache[name]
-        data = self.raw_parts.get(name)
-        if data is None:
-            return None
-        tree = parse_xml(data)
-        self.xml_cache[name] = tree
-        return tree
+        return self._parse_optional(name)
+
+    def has_part(self, name: str) -> bool:
+        return name in self.raw_parts or name in self.archive_parts
 
     def get_part_data(self, name: str) -> Optional[bytes]:
-        """Get binary data for a part by name."""
-        return self.raw_parts.get(name)
+        """Get binary data for a part by name, reading deferred parts from the archive."""
+        data = self.raw_parts.get(name)
+        if data is None and name in self.archive_parts:
+            data = self._require_archive().read(name)
+        return data
+
+    def get_part_size(self, name: str) -> Optional[int]:
+        """Uncompressed size of a part; deferred parts are sized from the zip directory."""
+        if name in self.archive_parts:
+            return self._require_archive().getinfo(name).file_size
+        if name not in self.raw_parts:
+            return None
+        if isinstance(self.raw_parts, ArchiveParts):
+            return self.raw_parts.part_size(name)
+        return len(self.raw_parts[name])
 
     # ------------------------------------------------------------------
     # Internal bootstrap
     def _initialize_caches(self) -> None:
-        self.content_types_xml = self._parse_required("[Content_Types].xml")
-        self.package_rels_xml = self._parse_optional(PACKAGE_REL_PATH)
-
-        self.document_xml = self._parse_required(DOCUMENT_XML_PATH)
-        self.styles_xml = self._parse_required(STYLES_XML_PATH)
-        self.numbering_xml = self._parse_optional(NUMBERING_XML_PATH)
-        self.document_rels_xml = self._parse_optional(DOCUMENT_RELS_PATH)
-        self.footnotes_xml = self._parse_optional(FOOTNOTES_XML_PATH)
-        self.endnotes_xml = self._parse_optional(ENDNOTES_XML_PATH)
-        self.comments_xml = self._parse_optional(COMMENTS_XML_PATH)
-        self.settings_xml = self._parse_optional(SETTINGS_XML_PATH)
-        self.glossary_xml = self._parse_optional(GLOSSARY_XML_PATH)
-
-        self.core_properties_xml = self._parse_optional(CORE_PROPS_PATH)
-        self.app_properties_xml = self._parse_optional(APP_PROPS_PATH)
-        self.custom_properties_xml = self._parse_optional(CUSTOM_PROPS_PATH)
-
-        self.headers = self._collect_prefixed("word/header")
-        self.footers = self._collect_prefixed("word/footer")
-        self.theme_parts = self._collect_prefixed("word/theme/")
-
+        # Only check that the required parts exist; XML is parsed on first access.
+        for name in REQUIRED_PARTS:
+            if not self.has_part(name):
+                raise KeyError(f"Required DOCX part missing: {name}")
+        self._prefetch_xml_parts()
         self.relationships = Relationships.from_package(self.raw_parts)
-        self.media = {
-            name: data for name, data in self.raw_parts.items() if name.startswith("word/media/")
-        }
+
+    # ------------------------------------------------------------------
+    # Lazily parsed parts
+    content_types_xml = property(lambda self: self._parse_optional(CONTENT_TYPES_PATH))
+    package_rels_xml = property(lambda self: self._parse_optional(PACKAGE_REL_PATH))
+    styles_xml = property(lambda self: self._parse_optional(STYLES_XML_PATH))
+    numbering_xml = property(lambda self: self._parse_optional(NUMBERING_XML_PATH))
+    document_rels_xml = property(lambda self: self._parse_optional(DOCUMENT_RELS_PATH))
+    footnotes_xml = property(lambda self: self._parse_optional(FOOTNOTES_XML_PATH))
+    endnotes_xml = property(lambda self: self._parse_optional(ENDNOTES_XML_PATH))
+    comments_xml = property(lambda self: self._parse_optional(COMMENTS_XML_PATH))
+    settings_xml = property(lambda self: self._parse_optional(SETTINGS_XML_PATH))
+    glossary_xml = property(lambda self: self._parse_optional(GLOSSARY_XML_PATH))
+    core_properties_xml = property(lambda self: self._parse_optional(CORE_PROPS_PATH))
+    app_properties_xml = property(lambda self: self._parse_optional(APP_PROPS_PATH))
+    custom_properties_xml = property(lambda self: self._parse_optional(CUSTOM_PROPS_PATH))
+    headers = property(lambda self: self._collect_prefixed(HEADER_PREFIX))
+    footers = property(lambda self: self._collect_prefixed(FOOTER_PREFIX))
+    theme_parts = property(lambda self: self._collect_prefixed(THEME_PREFIX))
 
     @property
     def document_relationships(self) -> DocumentRelationshipSummary:
         return self.relationships.document_summary()
 
+    def _require_archive(self) -> zipfile.ZipFile:
+        if self._closed:
+            raise ValueError("package is closed")
+        if self._archive is None:
+            raise ValueError("Package has no open archive")
+        return self._archive
+
+    def _open_part(self, name: str) -> Optional[BinaryIO]:
+        data = self.raw_parts.get(name)
+        if data is not None:
+            return io.BytesIO(data)
+        if name in self.archive_parts:
+            return self._require_archive().open(name)
+        return None
+
     def _parse_required(self, name: str) -> ET.ElementTree:
         tree = self._parse_optional(name)
         if tree is None:
@@ -145,17 +288,55 @@ class DocxPackage:
         data = self.raw_parts.get(name)
         if data is None:
             return None
-        tree = parse_xml(data)
-        self.xml_cache[name] = tree
+        tree = self.xml_cache[name] = _parse_part(name, data)
         return tree
 
     def _collect_prefixed(self, prefix: str) -> Dict[str, ET.ElementTree]:
-        collected: Dict[str, ET.ElementTree] = {}
-        for name, data in self.raw_parts.items():
-            if not name.startswith(prefix) or not name.endswith(".xml"):
-                continue
-            tree = parse_xml(data)
-            self.xml_cache[name] = tree
-            collected[name] = tree
-        return collected
+        return {name: self._parse_required(name) for name in self._part_family(prefix)}
+
+    def _part_family(self, prefix: str) -> Tuple[str, ...]:
+        """Names of the XML parts in one of ``PREFIXED_PART_FAMILIES``."""
+        if self._families is None:
+            grouped: Dict[str, List[str]] = {family: [] for family in PREFIXED_PART_FAMILIES}
+            for name in self.raw_parts:
+                if name.endswith(".xml") and name.startswith(PREFIXED_PART_FAMILIES):
+                    for family in PREFIXED_PART_FAMILIES:
+                        if name.startswith(family):
+                            grouped[family].append(name)
+                            break
+            self._families = {family: tuple(names) for family, names in grouped.items()}
+        return self._families[prefix]
+
+    def _prefetch_xml_parts(self) -> None:
+        """Parse the always-needed XML parts on a thread pool when lxml is available.
+
+        lxml releases the GIL while libxml2 parses, so large headers, footers
+        and styles parse concurrently. Results land in ``xml_cache`` where the
+        lazy part accessors pick them up.
+        """
+        if not HAS_LXML:
+            return
+        names = [name for name in self.raw_parts if name in EAGER_XML_PARTS]
+        for prefix in EAGER_XML_PREFIXES:
+            names.extend(self._part_family(prefix))
+        workers = min(8, len(names), os.cpu_count() or 1)
+        if workers < 2 or sum(self.get_part_size(name) for name in names) < PARALLEL_PARSE_MIN_BYTES:
+            return
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            trees = executor.map(_parse_part, names, [self.raw_parts[name] for name in names])
+            self.xml_cache.update(zip(names, trees))
+
+
+def _parse_part(name: str, data: bytes) -> ET.ElementTree:
+    structural = name in STRUCTURAL_XML_PARTS or name.endswith(".rels")
+    return parse_xml(data, strip_blank_text=structural)
+
 
+@functools.lru_cache(maxsize=PACKAGE_CACHE_SIZE)
+def _read_parts(path: Path, mtime_ns: int, size: int) -> Mapping[str, bytes]:
+    # The stat values only take part in the cache key. Everything, document.xml
+    # and media included, is read now: the file may be replaced afterwards.
+    with zipfile.ZipFile(path) as docx_zip:
+        return MappingProxyType({sys.intern(name): docx_zip.read(name) for name in docx_zip.namelist()})
@@ -1,12 +1,14 @@
 """Convert structured document blocks into absolutely positioned layout boxes."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence
+from dataclasses import dataclass, replace
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
 from docx_renderer.model.elements import (
     DocumentSection,
     DocumentTree,
+    DrawingReference,
     LayoutBox,
     LayoutModel,
     HeaderFooterContent,
@@ -27,6 +29,25 @@ DEFAULT_LINE_HEIGHT_PT = DEFAULT_FONT_SIZE_PT * 1.2
 DEFAULT_TABLE_CELL_PADDING_PT = 4.0
 DEFAULT_TABLE_BORDER_WIDTH_PT = 0.5
 EMU_PER_POINT = 12700.0
+# Run properties may carry the complex-script size only.
+_FONT_SIZE_TAGS = ("sz", "szCs")
+_EMPTY_CELL_PADDING = dict.fromkeys(("top", "bottom", "left", "right"), DEFAULT_TABLE_CELL_PADDING_PT)
+_EMPTY_CELL_BORDERS = dict.fromkeys(("top", "bottom", "left", "right"), DEFAULT_TABLE_BORDER_WIDTH_PT)
+_HEADER_FOOTER_PLACEMENTS = frozenset(("header", "footer"))
+# Floating image wrap modes that push following text below the image.
+_TEXT_WRAP_MODES = frozenset(("square", "tight", "through"))
+# Points per unit for string measurements; every suffix is two letters.
+_MEASUREMENT_UNITS = {"pt": 1.0, "in": 72.0, "cm": 28.3465, "mm": 2.83465, "px": 0.75}
+# Unsupported blocks carry no styling; their boxes share one read-only dict.
+_PLACEHOLDER_STYLE: Dict[str, object] = {}
+# Page setup used when a section carries no properties of its own.
+_DEFAULT_SECTION_PROPERTIES = SectionProperties()
+_EMPTY_CELL_HEIGHT_PT = DEFAULT_LINE_HEIGHT_PT + 2 * (DEFAULT_TABLE_CELL_PADDING_PT + DEFAULT_TABLE_BORDER_WIDTH_PT)
+
+
+def _local_name(tag: str) -> str:
+    """Strip a ``{namespace}`` or ``prefix:`` qualifier from a tag name."""
+    return tag[max(tag.rfind("}"), tag.rfind(":")) + 1 :]
 
 
 @dataclass(slots=True)
@@ -70,11 +91,55 @@ class SpacingInfo:
     line_rule: Optional[str] = None
 
 
+@dataclass(slots=True)
+class _StyleMetrics:
+    """Paragraph metrics derived from one style, computed once per style id.
+
+    ``font_size``, ``spacing`` and ``indent`` hold what the style itself
+    declares (``None`` where it is silent); ``resolved_spacing`` and
+    ``resolved_indent`` already have defaults applied for paragraphs that
+    carry no direct overrides. None of these are mutated after creation.
+    """
+
+    font_size: Optional[float]
+    spacing: SpacingInfo
+    indent: ParagraphIndent
+    resolved_spacing: SpacingInfo
+    resolved_indent: ParagraphIndent
+
+
 class LayoutCalculator:
     """Transform document structure into renderer-friendly layout."""
 
     def __init__(self, styles: StylesCatalog) -> None:
         self._styles = styles
+        # The catalog is read-only, so metrics stay valid for this calculator.
+        self._style_metrics_cache: Dict[Optional[str], _StyleMetrics] = {}
+        # Table cells whose content and geometry match an earlier cell reuse
+        # its layout; reset for every calculate() pass.
+        self._cell_layout_cache: Dict[tuple, Dict[str, object]] = {}
+        # Local tag -> first child node, per properties object. Entries hold the
+        # object itself so its id cannot be reused while cached.
+        self._property_index_cache: Dict[int, tuple[object, Dict[str, dict]]] = {}
+        # Local attribute name -> value, per property node; same keying as above.
+        self._attribute_index_cache: Dict[int, tuple[dict, Dict[str, str]]] = {}
+        # Paragraph box style dicts, shared by paragraphs with the same style id,
+        # spacing and indent. Boxes treat them as read-only.
+        self._paragraph_style_cache: Dict[tuple, Dict[str, object]] = {}
+        # Nested tables measure their content once per enclosing table pass;
+        # keyed by id() and holding the block, like the indexes above.
+        self._paragraph_min_width_cache: Dict[int, tuple[ParagraphElement, float]] = {}
+        self._table_min_width_cache: Dict[int, tuple[TableElement, float]] = {}
+        # Direct paragraph properties -> (spacing, indent); a paragraph is
+        # resolved both for table min widths and for layout.
+        self._direct_metrics_cache: Dict[int, tuple[object, tuple[SpacingInfo, ParagraphIndent]]] = {}
+        # Exact block type -> layout method; other types are resolved once and
+        # added by _resolve_block_handler.
+        self._block_handlers: Dict[type, Callable[..., LayoutBox]] = {
+            ParagraphElement: self._layout_paragraph,
+            TableElement: self._layout_table,
+            ImageElement: self._layout_image,
+        }
 
     # ------------------------------------------------------------------
     # Public API
@@ -82,33 +147,38 @@ class LayoutCalculator:
         """Return a LayoutModel with per-section pagination information."""
 
         boxes: List[LayoutBox] = []
-        pages: List[Sequence[LayoutBox]] = []
+        # Each section's boxes are a contiguous run of ``boxes``; pages are
+        # sliced out once layout is done.
+        page_bounds: List[tuple[int, int]] = []
+        self._cell_layout_cache.clear()
+        self._property_index_cache.clear()
+        self._attribute_index_cache.clear()
+        self._paragraph_style_cache.clear()
+        self._paragraph_min_width_cache.clear()
+        self._table_min_width_cache.clear()
+        self._direct_metrics_cache.clear()
 
         for section in self._iter_sections(tree):
             context = self._build_context(section.properties)
-            section_boxes: List[LayoutBox] = []
+            section_start = len(boxes)
 
             header_content = self._select_header_content(section.properties)
             if header_content:
                 header_box = self._layout_header_footer(header_content, context, placement="header")
                 if header_box:
                     boxes.append(header_box)
-                    section_boxes.append(header_box)
 
-            for block in section.blocks:
-                box = self._layout_block(block, context)
-                boxes.append(box)
-                section_boxes.append(box)
+            boxes.extend([self._layout_block(block, context) for block in section.blocks])
 
             footer_content = self._select_footer_content(section.properties)
             if footer_content:
                 footer_box = self._layout_header_footer(footer_content, context, placement="footer")
                 if footer_box:
                     boxes.append(footer_box)
-                    section_boxes.append(footer_box)
 
-            pages.append(section_boxes)
+            page_bounds.append((section_start, len(boxes)))
 
+        pages: List[Sequence[LayoutBox]] = [boxes[start:end] for start, end in page_bounds]
         return LayoutModel(boxes=boxes, pages=pages)
 
     def _select_header_content(self, properties: SectionProperties | None) -> Optional[HeaderFooterContent]:
@@ -130,7 +200,7 @@ class LayoutCalculator:
         if not content.blocks:
             return None
 
-        if placement not in {"header", "footer"}:
+        if placement not in _HEADER_FOOTER_PLACEMENTS:
             return None
 
         if placement == "header":
@@ -139,24 +209,18 @@ class LayoutCalculator:
             target_margin = base_context.footer_margin if base_context.footer_margin > 0 else base_context.margin_bottom
             start = content_start = max(base_context.page_height - target_margin, 0.0)
 
-        working_context = LayoutContext(
-            page_width=base_context.page_width,
-            page_height=base_context.page_height,
-            margin_left=base_context.margin_left,
-            margin_right=base_context.margin_right,
-            margin_top=base_context.margin_top,
-            margin_bottom=base_context.margin_bottom,
-            cursor_x=base_context.margin_left,
-            cursor_y=content_start,
-            header_margin=base_context.header_margin,
-            footer_margin=base_context.footer_margin,
-        )
-
-        child_boxes: List[LayoutBox] = []
-        for block in content.blocks:
-            child_boxes.append(self._layout_block(block, working_context))
+        # Child layout only moves the cursor, so the section context is reused
+        # with its cursor parked at the header/footer start and then restored.
+        saved_cursor = base_context.cursor_x, base_context.cursor_y
+        base_context.cursor_x = base_context.margin_left
+        base_context.cursor_y = content_start
+        try:
+            child_boxes = [self._layout_block(block, base_context) for block in content.blocks]
+            content_end = base_context.cursor_y
+        finally:
+            base_context.cursor_x, base_context.cursor_y = saved_cursor
 
-        total_height = max(working_context.cursor_y - content_start, 0.0)
+        total_height = max(content_end - content_start, 0.0)
 
         if placement == "header":
             container_y = self._clamp_header_top(base_context, start, total_height)
@@ -205,10 +269,8 @@ class LayoutCalculator:
         desired_top = usable_bottom - height
         min_top = context.margin_top
         max_top = context.page_height - context.margin_bottom
-        if desired_top < min_top:
-            desired_top = min_top
-        elif desired_top > max_top:
-            desired_top = max_top
+        # The lower bound wins when the margins overlap (min_top > max_top).
+        desired_top = min_top if desired_top < min_top else min(desired_top, max_top)
         offset = desired_top - start
         return desired_top, offset
 
@@ -226,20 +288,24 @@ class LayoutCalculator:
     def _build_context(self, properties: SectionProperties | None) -> LayoutContext:
         """Create a layout context using section-specific page setup."""
 
-        page_width = self._twips_to_points(getattr(properties, "page_width", None), DEFAULT_PAGE_WIDTH_PT)
-        page_height = self._twips_to_points(getattr(properties, "page_height", None), DEFAULT_PAGE_HEIGHT_PT)
+        if not isinstance(properties, SectionProperties):
+            properties = _DEFAULT_SECTION_PROPERTIES
+        to_points = self._twips_to_points
+
+        page_width = to_points(properties.page_width, DEFAULT_PAGE_WIDTH_PT)
+        page_height = to_points(properties.page_height, DEFAULT_PAGE_HEIGHT_PT)
 
-        orientation = getattr(properties, "orientation", None)
-        if orientation and orientation.lower() == "landscape" and page_width < page_height:
+        orientation = properties.orientation
+        if orientation and page_width < page_height and orientation.lower() == "landscape":
             page_width, page_height = page_height, page_width
 
-        margin_left = self._twips_to_points(getattr(properties, "margin_left", None), DEFAULT_MARGIN_PT)
-        margin_right = self._twips_to_points(getattr(properties, "margin_right", None), DEFAULT_MARGIN_PT)
-        margin_top = self._twips_to_points(getattr(properties, "margin_top", None), DEFAULT_MARGIN_PT)
-        margin_bottom = self._twips_to_points(getattr(properties, "margin_bottom", None), DEFAULT_MARGIN_PT)
+        margin_left = to_points(properties.margin_left, DEFAULT_MARGIN_PT)
+        margin_right = to_points(properties.margin_right, DEFAULT_MARGIN_PT)
+        margin_top = to_points(properties.margin_top, DEFAULT_MARGIN_PT)
+        margin_bottom = to_points(properties.margin_bottom, DEFAULT_MARGIN_PT)
 
-        header_margin = self._twips_to_points(getattr(properties, "margin_header", None), 0.0)
-        footer_margin = self._twips_to_points(getattr(properties, "margin_footer", None), 0.0)
+        header_margin = to_points(properties.margin_header, 0.0)
+        footer_margin = to_points(properties.margin_footer, 0.0)
 
         return LayoutContext(
             page_width=page_width,
@@ -257,17 +323,27 @@ class LayoutCalculator:
     # ------------------------------------------------------------------
     # Block layout
     def _layout_block(self, block, context: LayoutContext) -> LayoutBox:
-        if isinstance(block, ParagraphElement):
-            return self._layout_paragraph(block, context)
-        if isinstance(block, TableElement):
-            return self._layout_table(block, context)
-        if isinstance(block, ImageElement):
-            return self._layout_image(block, context)
-
-        return self._layout_placeholder(block, context)
+        handler = self._block_handlers.get(type(block))
+        if handler is None:
+            handler = self._resolve_block_handler(type(block))
+        return handler(block, context)
+
+    def _resolve_block_handler(self, block_type: type) -> Callable[..., LayoutBox]:
+        """Find the handler for a block type not seen yet (e.g. a subclass)."""
+        handler = self._layout_placeholder
+        for base, candidate in self._block_handlers.items():
+            if issubclass(block_type, base) and candidate != self._layout_placeholder:
+                handler = candidate
+                break
+        self._block_handlers[block_type] = handler
+        return handler
 
     def _layout_paragraph(self, paragraph: ParagraphElement, context: LayoutContext) -> LayoutBox:
-        text_content = "".join((run.text or "") for run in paragraph.runs)
+        runs = paragraph.runs
+        if len(runs) == 1:
+            text_content = runs[0].text or ""
+        else:
+            text_content = "".join([run.text or "" for run in runs])
         resolved_style = self._styles.get(paragraph.style_id)
 
         font_size = self._resolve_font_size(paragraph, resolved_style)
@@ -279,12 +355,29 @@ class LayoutCalculator:
             context.cursor_y += spacing.before
 
         available_width = max(context.available_width - indent.left - indent.right, 0.0)
-        lines = self._wrap_text(text_content, available_width, font_size)
-        box_height = line_height * max(len(lines), 1)
-
-        style: Dict[str, object] = {"styleId": paragraph.style_id}
-        if isinstance(resolved_style, StyleDefinition):
-            style["resolved"] = resolved_style.properties
+        if text_content:
+            lines = self._wrap_text(text_content, available_width, font_size)
+            box_height = line_height * max(len(lines), 1)
+        else:
+            # Blank paragraphs still take spacing and one line of height.
+            lines = [""]
+            box_height = line_height
+
+        style_key = (
+            paragraph.style_id,
+            spacing.before,
+            spacing.after,
+            spacing.line,
+            spacing.line_rule,
+            indent.left,
+            indent.right,
+            indent.first_line,
+        )
+        style = self._paragraph_style_cache.get(style_key)
+        if style is None:
+            style = self._paragraph_style_cache[style_key] = self._paragraph_style(
+                paragraph.style_id, resolved_style, spacing, indent
+            )
 
         box = LayoutBox(
             element_type="paragraph",
@@ -300,42 +393,66 @@ class LayoutCalculator:
             style=style,
         )
 
-        box.style["spacing"] = {
+        context.cursor_y += box_height + spacing.after
+        return box
+
+    @staticmethod
+    def _paragraph_style(
+        style_id: Optional[str],
+        resolved_style: Optional[StyleDefinition],
+        spacing: SpacingInfo,
+        indent: ParagraphIndent,
+    ) -> Dict[str, object]:
+        style: Dict[str, object] = {"styleId": style_id}
+        if isinstance(resolved_style, StyleDefinition):
+            style["resolved"] = resolved_style.properties
+        style["spacing"] = {
             "before": spacing.before,
             "after": spacing.after,
             "line": spacing.line,
             "lineRule": spacing.line_rule,
         }
-        box.style["indent"] = {
+        style["indent"] = {
             "left": indent.left,
             "right": indent.right,
             "firstLine": indent.first_line,
         }
-
-        context.cursor_y += box_height + spacing.after
-        return box
+        return style
 
     def _layout_table(self, table: TableElement, context: LayoutContext) -> LayoutBox:
         available_width = context.available_width
         column_count = self._compute_table_column_count(table)
         min_widths = self._compute_table_min_widths(table, column_count, available_width)
         column_widths, table_width = self._resolve_column_widths(table, available_width, column_count, min_widths)
+        # column_offsets[i] is the x offset of column i, summed left to right
+        # exactly as sum(column_widths[:i]) would.
+        column_offsets = list(accumulate(column_widths, initial=0.0))
 
         cells_layout: List[List[Dict[str, object]]] = []
         row_heights: List[float] = []
         y_offset = 0.0
         table_x = context.margin_left
         table_y = context.cursor_y
+        has_vertical_merge = False
 
         for row_idx, row in enumerate(table.rows):
+            # Per-cell geometry is kept in parallel lists alongside the output
+            # dicts, so the placement pass below does not read it back out.
             row_cells: List[Dict[str, object]] = []
+            row_starts: List[int] = []
+            row_widths: List[float] = []
             row_height = 0.0
             column_index = 0
 
             for cell in row.cells:
                 span = self._resolve_grid_span(cell.properties)
                 span = max(1, min(span, column_count - column_index))
-                cell_width = sum(column_widths[column_index : column_index + span])
+                if span == 1 and column_index < len(column_widths):
+                    cell_width = column_widths[column_index]
+                else:
+                    # Summed rather than taken from column_offsets so widths
+                    # match the per-column values bit for bit.
+                    cell_width = sum(column_widths[column_index : column_index + span])
                 merge_info = self._resolve_vertical_merge(cell.properties)
 
                 cell_layout = self._layout_table_cell(
@@ -349,9 +466,12 @@ class LayoutCalculator:
                 cell_layout["rowIndex"] = row_idx
                 if merge_info:
                     cell_layout["vMerge"] = merge_info
+                    has_vertical_merge = True
 
                 row_height = max(row_height, cell_layout["height"])
                 row_cells.append(cell_layout)
+                row_starts.append(column_index)
+                row_widths.append(cell_width)
                 column_index += span
 
             if column_index < column_count:
@@ -361,28 +481,30 @@ class LayoutCalculator:
                 filler["rowIndex"] = row_idx
                 row_height = max(row_height, filler["height"])
                 row_cells.append(filler)
+                row_starts.append(column_index)
+                row_widths.append(remaining_width)
 
             if row_height == 0.0:
-                row_height = DEFAULT_LINE_HEIGHT_PT + 2 * (DEFAULT_TABLE_CELL_PADDING_PT + DEFAULT_TABLE_BORDER_WIDTH_PT)
+                row_height = _EMPTY_CELL_HEIGHT_PT
 
-            for cell_layout in row_cells:
-                start = cell_layout.get("columnIndex", 0)
-                span = cell_layout.get("colSpan", 1)
-                width = sum(column_widths[start : start + span]) if column_count else cell_layout["width"]
+            row_y = table_y + y_offset
+            for cell_layout, start, width in zip(row_cells, row_starts, row_widths):
                 cell_layout["width"] = width
                 cell_layout["height"] = row_height
-                cell_layout["x"] = table_x + sum(column_widths[:start])
-                cell_layout["y"] = table_y + y_offset
+                cell_layout["x"] = table_x + column_offsets[start]
+                cell_layout["y"] = row_y
                 cell_layout["baseRow"] = row_idx
 
             cells_layout.append(row_cells)
             row_heights.append(row_height)
             y_offset += row_height
 
-        self._apply_vertical_merges(cells_layout, row_heights)
+        # Without vMerge cells every cell keeps the rowSpan of 1 it was built with.
+        if has_vertical_merge:
+            self._apply_vertical_merges(cells_layout, row_heights)
 
         if not row_heights:
-            row_heights = [DEFAULT_LINE_HEIGHT_PT + 2 * (DEFAULT_TABLE_CELL_PADDING_PT + DEFAULT_TABLE_BORDER_WIDTH_PT)]
+            row_heights = [_EMPTY_CELL_HEIGHT_PT]
             cells_layout = [[self._create_empty_cell(available_width, 0, 1)]]
             column_widths = [available_width]
             table_width = available_width
@@ -495,6 +617,19 @@ class LayoutCalculator:
         padding = self._resolve_table_cell_padding(cell.properties if cell else None, table_properties)
         borders = self._resolve_table_cell_borders(cell.properties if cell else None, table_properties)
 
+        content_key = self._cell_content_key(cell)
+        cache_key = None
+        if content_key is not None:
+            cache_key = (content_key, column_width, tuple(padding.items()), tuple(borders.items()))
+            cached = self._cell_layout_cache.get(cache_key)
+            if cached is not None:
+                # Each cell gets its own copies of the container and child
+                # boxes, so positioning one cell never moves another.
+                layout = dict(cached)
+                layout["boxes"] = [replace(box) for box in cached["boxes"]]
+                layout["colSpan"] = span
+                return layout
+
         margin_left = padding["left"] + borders["left"]
         margin_right = padding["right"] + borders["right"]
         margin_top = padding["top"] + borders["top"]
@@ -520,7 +655,7 @@ class LayoutCalculator:
         content_height = max(inner_context.cursor_y - margin_top, 0.0)
         total_height = max(content_height + margin_top + margin_bottom, margin_top + margin_bottom)
 
-        return {
+        layout = {
             "width": column_width,
             "height": total_height,
             "padding": padding,
@@ -536,26 +671,34 @@ class LayoutCalculator:
             "x": 0.0,
             "y": 0.0,
         }
+        if cache_key is not None:
+            cached = self._cell_layout_cache[cache_key] = dict(layout)
+            cached["boxes"] = list(cell_boxes)
+        return layout
+
+    def _cell_content_key(self, cell: Optional[TableCell]) -> Optional[tuple]:
+        """Hashable stand-in for a cell's paragraph content, or None if it has other blocks.
+
+        Property mappings are compared by identity: the parser shares identical
+        rPr/pPr blocks, and the tree keeps them alive for the whole pass.
+        """
+        if cell is None:
+            return ()
+        key = []
+        for block in cell.content:
+            if type(block) is not ParagraphElement:
+                return None
+            runs = tuple((run.text, id(run.properties)) for run in block.runs)
+            key.append((block.style_id, id(block.properties), runs))
+        return tuple(key)
 
     def _create_empty_cell(self, width: float, column_index: int, col_span: int) -> Dict[str, object]:
-        padding_base = {
-            "top": DEFAULT_TABLE_CELL_PADDING_PT,
-            "bottom": DEFAULT_TABLE_CELL_PADDING_PT,
-            "left": DEFAULT_TABLE_CELL_PADDING_PT,
-            "right": DEFAULT_TABLE_CELL_PADDING_PT,
-        }
-        borders_base = {
-            "top": DEFAULT_TABLE_BORDER_WIDTH_PT,
-            "bottom": DEFAULT_TABLE_BORDER_WIDTH_PT,
-            "left": DEFAULT_TABLE_BORDER_WIDTH_PT,
-            "right": DEFAULT_TABLE_BORDER_WIDTH_PT,
-        }
-        height = DEFAULT_LINE_HEIGHT_PT + 2 * (DEFAULT_TABLE_CELL_PADDING_PT + DEFAULT_TABLE_BORDER_WIDTH_PT)
+        # Filler cells share the default padding/border dicts; nothing edits them.
         return {
             "width": width,
-            "height": height,
-            "padding": padding_base,
-            "borders": borders_base,
+            "height": _EMPTY_CELL_HEIGHT_PT,
+            "padding": _EMPTY_CELL_PADDING,
+            "borders": _EMPTY_CELL_BORDERS,
             "contentHeight": 0.0,
             "boxes": [],
             "colSpan": col_span,
@@ -630,7 +773,7 @@ class LayoutCalculator:
         )
 
         if floating:
-            if wrap_mode in {"square", "tight", "through"}:
+            if wrap_mode in _TEXT_WRAP_MODES:
                 context.cursor_y = max(context.cursor_y, y + height + margins["bottom"])
             elif wrap_mode == "behind-text" or wrap_mode == "infront-of-text":
                 # Floating behind/in front of text does not influence cursor
@@ -651,7 +794,7 @@ class LayoutCalculator:
             y=context.cursor_y,
             width=context.available_width,
             height=height,
-            style={},
+            style=_PLACEHOLDER_STYLE,
         )
         context.cursor_y += height
         return box
@@ -666,7 +809,7 @@ class LayoutCalculator:
                 font_sizes.append(size)
 
         if not font_sizes:
-            style_size = self._extract_font_size_from_style(style)
+            style_size = self._style_metrics(style).font_size
             if style_size is not None:
                 font_sizes.append(style_size)
 
@@ -676,8 +819,11 @@ class LayoutCalculator:
         return DEFAULT_FONT_SIZE_PT
 
     def _resolve_spacing(self, paragraph: ParagraphElement, style: Optional[StyleDefinition]) -> SpacingInfo:
-        direct = self._extract_spacing_info(paragraph.properties)
-        styled = self._extract_spacing_info_from_style(style)
+        metrics = self._style_metrics(style)
+        if not paragraph.properties:
+            return metrics.resolved_spacing
+        direct = self._direct_paragraph_metrics(paragraph.properties)[0]
+        styled = metrics.spacing
 
         before = self._coalesce_float(direct.before, styled.before, default=0.0)
         after = self._coalesce_float(direct.after, styled.after, default=0.0)
@@ -705,15 +851,54 @@ class LayoutCalculator:
     def _resolve_paragraph_indent(
         self, paragraph: ParagraphElement, style: Optional[StyleDefinition]
     ) -> ParagraphIndent:
-        direct = self._extract_indent(paragraph.properties)
-        styled = self._extract_indent_from_style(style)
+        metrics = self._style_metrics(style)
+        if not paragraph.properties:
+            return metrics.resolved_indent
+        direct = self._direct_paragraph_metrics(paragraph.properties)[1]
+        styled = metrics.indent
 
-        left = self._coalesce_float(direct.get("left"), styled.get("left"), default=0.0) or 0.0
-        right = self._coalesce_float(direct.get("right"), styled.get("right"), default=0.0) or 0.0
-        first_line = self._coalesce_float(direct.get("firstLine"), styled.get("firstLine"), default=0.0) or 0.0
+        left = self._coalesce_float(direct.left, styled.left, default=0.0) or 0.0
+        right = self._coalesce_float(direct.right, styled.right, default=0.0) or 0.0
+        first_line = self._coalesce_float(direct.first_line, styled.first_line, default=0.0) or 0.0
 
         return ParagraphIndent(left=left, right=right, first_line=first_line)
 
+    def _direct_paragraph_metrics(self, properties) -> tuple[SpacingInfo, ParagraphIndent]:
+        """Return the spacing and indent set directly on a paragraph, extracted once per object."""
+        entry = self._direct_metrics_cache.get(id(properties))
+        if entry is not None and entry[0] is properties:
+            return entry[1]
+        metrics = (self._extract_spacing_info(properties), self._extract_indent(properties))
+        self._direct_metrics_cache[id(properties)] = (properties, metrics)
+        return metrics
+
+    def _style_metrics(self, style: Optional[StyleDefinition]) -> _StyleMetrics:
+        """Return the style's own metrics, memoized by style id."""
+        if not isinstance(style, StyleDefinition):
+            style = None
+        key = style.style_id if style is not None else None
+        metrics = self._style_metrics_cache.get(key)
+        if metrics is None:
+            spacing = self._extract_spacing_info_from_style(style)
+            indent = self._extract_indent_from_style(style)
+            metrics = self._style_metrics_cache[key] = _StyleMetrics(
+                font_size=self._extract_font_size_from_style(style),
+                spacing=spacing,
+                indent=indent,
+                resolved_spacing=SpacingInfo(
+                    before=self._coalesce_float(spacing.before, default=0.0),
+                    after=self._coalesce_float(spacing.after, default=0.0),
+                    line=spacing.line,
+                    line_rule=spacing.line_rule,
+                ),
+                resolved_indent=ParagraphIndent(
+                    left=self._coalesce_float(indent.left, default=0.0) or 0.0,
+                    right=self._coalesce_float(indent.right, default=0.0) or 0.0,
+                    first_line=self._coalesce_float(indent.first_line, default=0.0) or 0.0,
+                ),
+            )
+        return metrics
+
     # ------------------------------------------------------------------
     # Property extraction
     def _extract_font_size_from_properties(self, properties) -> Optional[float]:
@@ -725,14 +910,7 @@ class LayoutCalculator:
             if isinstance(size, (int, float)):
                 return self._normalise_font_size(size)
 
-        for node in self._get_property_nodes(properties):
-            tag = node.get("tag", "")
-            if tag.endswith("sz") or tag.endswith("szCs"):
-                value = self._parse_int_attribute(node, "val")
-                if value is not None:
-                    return self._normalise_font_size(value)
-
-        return None
+        return self._font_size_from_nodes(properties)
 
     def _extract_font_size_from_style(self, style: Optional[StyleDefinition]) -> Optional[float]:
         if not isinstance(style, StyleDefinition):
@@ -743,9 +921,13 @@ class LayoutCalculator:
             if isinstance(size, (int, float)):
                 return self._normalise_font_size(size)
 
-        for node in style.properties.get("rPr", []):
-            tag = node.get("tag", "")
-            if tag.endswith("sz") or tag.endswith("szCs"):
+        return self._font_size_from_nodes(style.properties.get("rPr"))
+
+    def _font_size_from_nodes(self, properties) -> Optional[float]:
+        index = self._property_index(properties)
+        for local_tag in _FONT_SIZE_TAGS:
+            node = index.get(local_tag)
+            if node is not None:
                 value = self._parse_int_attribute(node, "val")
                 if value is not None:
                     return self._normalise_font_size(value)
@@ -792,21 +974,21 @@ class LayoutCalculator:
             return SpacingInfo(before=None, after=None, line=None, line_rule=None)
         return self._extract_spacing_info(nodes)
 
-    def _extract_indent(self, properties) -> Dict[str, Optional[float]]:
-        indent: Dict[str, Optional[float]] = {"left": None, "right": None, "firstLine": None}
+    def _extract_indent(self, properties) -> ParagraphIndent:
+        indent = ParagraphIndent(left=None, right=None, first_line=None)
 
         if not properties:
             return indent
 
         if isinstance(properties, dict):
             if isinstance(properties.get("indent_left"), (int, float)):
-                indent["left"] = properties["indent_left"] / 20.0
+                indent.left = properties["indent_left"] / 20.0
             if isinstance(properties.get("indent_right"), (int, float)):
-                indent["right"] = properties["indent_right"] / 20.0
+                indent.right = properties["indent_right"] / 20.0
             if isinstance(properties.get("first_line_indent"), (int, float)):
-                indent["firstLine"] = properties["first_line_indent"] / 20.0
+                indent.first_line = properties["first_line_indent"] / 20.0
             if isinstance(properties.get("hanging_indent"), (int, float)):
-                indent["firstLine"] = -(properties["hanging_indent"] / 20.0)
+                indent.first_line = -(properties["hanging_indent"] / 20.0)
 
         ind_node = self._find_property_node(properties, "ind")
         if ind_node:
@@ -816,22 +998,22 @@ class LayoutCalculator:
             hanging = self._parse_twips_attribute(ind_node, "hanging")
 
             if left is not None:
-                indent["left"] = left
+                indent.left = left
             if right is not None:
-                indent["right"] = right
+                indent.right = right
             if first_line is not None:
-                indent["firstLine"] = first_line
+                indent.first_line = first_line
             if hanging is not None:
-                indent["firstLine"] = -hanging
+                indent.first_line = -hanging
 
         return indent
 
-    def _extract_indent_from_style(self, style: Optional[StyleDefinition]) -> Dict[str, Optional[float]]:
+    def _extract_indent_from_style(self, style: Optional[StyleDefinition]) -> ParagraphIndent:
         if not isinstance(style, StyleDefinition):
-            return {"left": None, "right": None, "firstLine": None}
+            return ParagraphIndent(left=None, right=None, first_line=None)
         nodes = style.properties.get("pPr")
         if not nodes:
-            return {"left": None, "right": None, "firstLine": None}
+            return ParagraphIndent(left=None, right=None, first_line=None)
         return self._extract_indent(nodes)
 
     # ------------------------------------------------------------------
@@ -846,11 +1028,18 @@ class LayoutCalculator:
         return []
 
     def _find_property_node(self, properties, local_tag: str) -> Optional[dict]:
+        return self._property_index(properties).get(local_tag)
+
+    def _property_index(self, properties) -> Dict[str, dict]:
+        """Map local tag names to the first matching child node, built once per object."""
+        entry = self._property_index_cache.get(id(properties))
+        if entry is not None and entry[0] is properties:
+            return entry[1]
+        index: Dict[str, dict] = {}
         for node in self._get_property_nodes(properties):
-            tag = node.get("tag", "")
-            if tag.endswith(local_tag):
-                return node
-        return None
+            index.setdefault(_local_name(node.get("tag", "")), node)
+        self._property_index_cache[id(properties)] = (properties, index)
+        return index
 
     def _parse_twips_attribute(self, node: dict, local_name: str) -> Optional[float]:
         value = self._get_attribute(node, local_name)
@@ -876,10 +1065,18 @@ class LayoutCalculator:
         return numeric
 
     def _get_attribute(self, node: dict, local_name: str) -> Optional[str]:
+        return self._attribute_index(node).get(local_name)
+
+    def _attribute_index(self, node: dict) -> Dict[str, str]:
+        """Map local attribute names to values, built once per node."""
+        entry = self._attribute_index_cache.get(id(node))
+        if entry is not None and entry[0] is node:
+            return entry[1]
+        index: Dict[str, str] = {}
         for key, value in node.get("attributes", {}).items():
-            if key.endswith(local_name):
-                return value
-        return None
+            index.setdefault(_local_name(key), value)
+        self._attribute_index_cache[id(node)] = (node, index)
+        return index
 
     def _parse_int_attribute(self, node: dict, local_name: str) -> Optional[int]:
         value = self._get_attribute(node, local_name)
@@ -940,7 +1137,7 @@ class LayoutCalculator:
                 node = self._find_property_node(cell_properties, "vMerge")
         elif isinstance(cell_properties, list):
             for item in cell_properties:
-                if isinstance(item, dict) and item.get("tag", "").endswith("vMerge"):
+                if isinstance(item, dict) and _local_name(item.get("tag", "")) == "vMerge":
                     node = item
                     break
 
@@ -963,26 +1160,24 @@ class LayoutCalculator:
         if column_count <= 0:
             return [available_width]
 
-        min_widths = [0.0 for _ in range(column_count)]
+        min_widths = [0.0] * column_count
         for row in table.rows:
             column_index = 0
             for cell in row.cells:
                 span = self._resolve_grid_span(cell.properties)
                 span = max(1, min(span, column_count - column_index))
                 cell_min_width = self._calculate_cell_min_width(cell, table.properties, available_width, span)
-                per_column = cell_min_width / span if span else cell_min_width
-                for offset in range(span):
-                    idx = column_index + offset
-                    if idx < column_count:
-                        min_widths[idx] = max(min_widths[idx], per_column)
+                # Spans are clamped to the grid, so only cells past its last
+                # column (span forced to 1) fall outside min_widths.
+                if column_index < column_count:
+                    per_column = cell_min_width / span
+                    for idx in range(column_index, column_index + span):
+                        if per_column > min_widths[idx]:
+                            min_widths[idx] = per_column
                 column_index += span
 
-        baseline = DEFAULT_LINE_HEIGHT_PT + 2 * (DEFAULT_TABLE_CELL_PADDING_PT + DEFAULT_TABLE_BORDER_WIDTH_PT)
-        for idx, width in enumerate(min_widths):
-            if width == 0.0:
-                min_widths[idx] = baseline
-
-        return min_widths
+        baseline = _EMPTY_CELL_HEIGHT_PT
+        return [width if width != 0.0 else baseline for width in min_widths]
 
     def _calculate_cell_min_width(
         self,
@@ -1056,19 +1251,25 @@ class LayoutCalculator:
         return DEFAULT_LINE_HEIGHT_PT
 
     def _measure_paragraph_min_width(self, paragraph: ParagraphElement) -> float:
+        entry = self._paragraph_min_width_cache.get(id(paragraph))
+        if entry is not None and entry[0] is paragraph:
+            return entry[1]
+        width = self._compute_paragraph_min_width(paragraph)
+        self._paragraph_min_width_cache[id(paragraph)] = (paragraph, width)
+        return width
+
+    def _compute_paragraph_min_width(self, paragraph: ParagraphElement) -> float:
         resolved_style = self._styles.get(paragraph.style_id)
         font_size = self._resolve_font_size(paragraph, resolved_style)
         indent = self._resolve_paragraph_indent(paragraph, resolved_style)
 
         text_content = "".join((run.text or "") for run in paragraph.runs)
-        width = 0.0
-        words = [word for word in text_content.split(" ") if word]
-        if words:
-            width = max(self._estimate_text_width(word, font_size) for word in words)
-        elif text_content:
+        # Width grows with length, so only the longest word needs measuring.
+        width = self._estimate_text_width(max(text_content.split(" "), key=len), font_size)
+        if not width and text_content:
             width = self._estimate_text_width(text_content, font_size)
 
-        drawing_widths = [self._measure_drawing_min_width(getattr(run, "drawing", None)) for run in paragraph.runs]
+        drawing_widths = [self._measure_drawing_min_width(run.drawing) for run in paragraph.runs]
         if drawing_widths:
             width = max(width, max(drawing_widths))
 
@@ -1078,22 +1279,26 @@ class LayoutCalculator:
         return width
 
     def _measure_table_min_width(self, table: TableElement) -> float:
+        entry = self._table_min_width_cache.get(id(table))
+        if entry is not None and entry[0] is table:
+            return entry[1]
         column_count = self._compute_table_column_count(table)
-        min_widths = self._compute_table_min_widths(table, column_count, DEFAULT_PAGE_WIDTH_PT)
-        return sum(min_widths)
+        width = sum(self._compute_table_min_widths(table, column_count, DEFAULT_PAGE_WIDTH_PT))
+        self._table_min_width_cache[id(table)] = (table, width)
+        return width
 
     def _measure_image_min_width(self, image: ImageElement) -> float:
         width = self._emu_to_points(image.width_emu) if image.width_emu else 0.0
         margins = self._resolve_image_margins(image)
         return width + margins["left"] + margins["right"]
 
-    def _measure_drawing_min_width(self, drawing) -> float:
+    def _measure_drawing_min_width(self, drawing: Optional[DrawingReference]) -> float:
         if drawing is None:
             return 0.0
 
-        width = self._emu_to_points(getattr(drawing, "width_emu", None))
+        width = self._emu_to_points(drawing.width_emu)
         if width == 0.0:
-            height = getattr(drawing, "height_emu", None)
+            height = drawing.height_emu
             if height:
                 width = self._emu_to_points(height) * (4.0 / 3.0)
         return width
@@ -1112,8 +1317,7 @@ class LayoutCalculator:
 
         widths: List[float] = []
         for child in self._get_property_nodes(node):
-            tag = child.get("tag", "")
-            if tag.endswith("gridCol"):
+            if _local_name(child.get("tag", "")) == "gridCol":
                 width = self._parse_twips_attribute(child, "w")
                 if width is not None:
                     widths.append(width)
@@ -1211,8 +1415,7 @@ class LayoutCalculator:
 
     def _apply_margin_node(self, node: dict, target: Dict[str, float]) -> None:
         for child in self._get_property_nodes(node):
-            tag = child.get("tag", "")
-            local = tag.split("}")[-1]
+            local = _local_name(child.get("tag", ""))
             if local in target:
                 value = self._parse_twips_attribute(child, "w")
                 type_attr = (self._get_attribute(child, "type") or "").lower()
@@ -1247,8 +1450,7 @@ class LayoutCalculator:
 
     def _apply_border_node(self, node: dict, target: Dict[str, float]) -> None:
         for child in self._get_property_nodes(node):
-            tag = child.get("tag", "")
-            local = tag.split("}")[-1]
+            local = _local_name(child.get("tag", ""))
             if local in target:
                 width = self._parse_border_width(child)
                 if width is not None:
@@ -1378,33 +1580,27 @@ class LayoutCalculator:
         if not text:
             return [""]
 
-        words = text.split(" ")
-        if not words:
+        # Every character has the same estimated width (see _estimate_text_width),
+        # so wrapping works on character counts and converts once per test.
+        char_width = self._estimate_text_width(" ", font_size)
+        if len(text) * char_width <= max_width:
             return [text]
 
+        words = text.split(" ")
         lines: List[str] = []
-        current_line: List[str] = []
-        current_width = 0.0
-        space_width = self._estimate_text_width(" ", font_size)
-
-        for word in words:
-            word_width = self._estimate_text_width(word, font_size)
-            projected = current_width + (space_width if current_line else 0.0) + word_width
-
-            if current_line and projected > max_width:
-                lines.append(" ".join(current_line))
-                current_line = [word]
-                current_width = word_width
+        line_start = 0
+        line_chars = len(words[0])
+
+        for index in range(1, len(words)):
+            word_chars = len(words[index])
+            if (line_chars + 1 + word_chars) * char_width > max_width:
+                lines.append(" ".join(words[line_start:index]))
+                line_start = index
+                line_chars = word_chars
             else:
-                if current_line:
-                    current_width += space_width + word_width
-                else:
-                    current_width = word_width
-                current_line.append(word)
-
-        if current_line:
-            lines.append(" ".join(current_line))
+                line_chars += 1 + word_chars
 
+        lines.append(" ".join(words[line_start:]))
         return lines
 
     @staticmethod
@@ -1434,19 +1630,12 @@ class LayoutCalculator:
             return float(value)
         if isinstance(value, str):
             text = value.strip().lower()
-            unit_map = {
-                "pt": 1.0,
-                "in": 72.0,
-                "cm": 28.3465,
-                "mm": 2.83465,
-                "px": 0.75,
-            }
-            for unit, factor in unit_map.items():
-                if text.endswith(unit):
-                    try:
-                        return float(text[:-len(unit)]) * factor
-                    except ValueError:
-                        return None
+            factor = _MEASUREMENT_UNITS.get(text[-2:])
+            if factor is not None:
+                try:
+                    return float(text[:-2]) * factor
+                except ValueError:
+                    return None
             try:
                 numeric = float(text)
             except ValueError:
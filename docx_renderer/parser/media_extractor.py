@@ -5,7 +5,6 @@ Extracts and catalogs media files (images, fonts, etc.) from DOCX package
 with metadata and access paths for rendering pipeline.
 """
 
-import base64
 import mimetypes
 from dataclasses import dataclass
 from pathlib import Path
@@ -16,7 +15,7 @@ from .docx_loader import DocxPackage
 from .rels_parser import Relationships
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaCatalog:
     """Catalog of all media assets found in DOCX package."""
     
@@ -61,12 +60,38 @@ class MediaCatalog:
         return None
 
 
+class MediaParts:
+    """Media payloads read from the package on first request.
+
+    The media catalog and the drawing resolver share one instance, so each
+    part is decompressed at most once and parts nobody asks for are never read.
+    """
+
+    __slots__ = ("_package", "_data")
+
+    def __init__(self, package: Optional[DocxPackage], data: Optional[Dict[str, Optional[bytes]]] = None) -> None:
+        self._package = package
+        self._data: Dict[str, Optional[bytes]] = data if data is not None else {}
+
+    def __call__(self, target: str) -> Optional[bytes]:
+        if target not in self._data:
+            if self._package is None:
+                raise ValueError("package is closed")
+            self._data[target] = self._package.get_part_data(target)
+        return self._data[target]
+
+    def __reduce__(self):
+        # Only payloads already read survive pickling; the package does not.
+        return (MediaParts, (None, self._data))
+
+
 class MediaExtractor:
     """Extracts media assets and fonts from DOCX package."""
     
-    def __init__(self, package: DocxPackage, relationships: Relationships):
+    def __init__(self, package: DocxPackage, relationships: Relationships, parts: Optional[MediaParts] = None):
         self.package = package
         self.relationships = relationships
+        self.parts = parts if parts is not None else MediaParts(package)
     
     def extract_media_catalog(self) -> MediaCatalog:
         """Extract complete media catalog from DOCX package."""
@@ -102,25 +127,24 @@ class MediaExtractor:
         
         for rel_id, target in media_rels.items():
             try:
-                # Get binary data from package
-                binary_data = self.package.get_part_data(target)
-                if binary_data is None:
+                # Size comes from the zip directory; bytes are read on first use
+                size = self.package.get_part_size(target)
+                if size is None:
                     continue
                 
                 # Determine media type
                 media_type = self._get_media_type(target)
                 
                 # Extract metadata
-                metadata = self._extract_media_metadata(target, binary_data)
+                metadata = self._extract_media_metadata(target)
                 
                 asset = MediaAsset(
                     relationship_id=rel_id,
                     target_path=target,
                     media_type=media_type,
-                    binary_data=binary_data,
-                    base64_data=base64.b64encode(binary_data).decode('utf-8'),
-                    size=len(binary_data),
-                    metadata=metadata
+                    size=size,
+                    metadata=metadata,
+                    _read=self.parts
                 )
                 
                 assets[rel_id] = asset
@@ -142,21 +166,20 @@ class MediaExtractor:
         
         for rel_id, target in font_rels.items():
             try:
-                binary_data = self.package.get_part_data(target)
-                if binary_data is None:
+                size = self.package.get_part_size(target)
+                if size is None:
                     continue
                 
-                # Try to extract font family name from filename or metadata
-                font_family = self._extract_font_family(target, binary_data)
+                # Try to extract font family name from filename
+                font_family = self._extract_font_family(target)
                 
                 asset = MediaAsset(
                     relationship_id=rel_id,
                     target_path=target,
                     media_type='application/font-woff',  # Default, may vary
-                    binary_data=binary_data,
-                    base64_data=base64.b64encode(binary_data).decode('utf-8'),
-                    size=len(binary_data),
-                    metadata={'font_family': font_family}
+                    size=size,
+                    metadata={'font_family': font_family},
+                    _read=self.parts
                 )
                 
                 fonts[font_family] = asset
@@ -197,23 +220,12 @@ class MediaExtractor:
         mime_type, _ = mimetypes.guess_type(target_path)
         return mime_type or 'application/octet-stream'
     
-    def _extract_media_metadata(self, target_path: str, binary_data: bytes) -> Dict[str, Union[str, int]]:
-        """Extract metadata from media file."""
-        metadata = {
+    def _extract_media_metadata(self, target_path: str) -> Dict[str, Union[str, int]]:
+        """Extract metadata from the media file name; the payload is not read here."""
+        return {
             'filename': Path(target_path).name,
             'extension': Path(target_path).suffix.lower()
         }
-        
-        # Try to extract basic image metadata
-        if target_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-            try:
-                # Basic image size detection (this is simplified)
-                # In a full implementation, you'd use PIL or similar
-                metadata.update(self._get_image_dimensions(binary_data))
-            except Exception:
-                pass
-        
-        return metadata
     
     def _get_image_dimensions(self, binary_data: bytes) -> Dict[str, int]:
         """Extract image dimensions from binary data (simplified)."""
@@ -238,7 +250,7 @@ class MediaExtractor:
         
         return {}
     
-    def _extract_font_family(self, target_path: str, binary_data: bytes) -> str:
+    def _extract_font_family(self, target_path: str) -> str:
         """Extract font family name from font file."""
         # Simplified implementation - in practice you'd parse font metadata
         filename = Path(target_path).stem
@@ -254,28 +266,24 @@ class MediaExtractor:
 class MediaResolver:
     """Maps relationship identifiers to actual media payloads."""
 
-    def __init__(self, relationships: Relationships, media_catalog: MediaCatalog) -> None:
+    def __init__(self, relationships: Relationships, package: DocxPackage, parts: Optional[MediaParts] = None) -> None:
         self._relationships = relationships
-        self._media_catalog = media_catalog
+        self._parts = parts if parts is not None else MediaParts(package)
 
     def resolve_image(self, part_name: str, r_id: str) -> Optional[bytes]:
         """Return binary data for an image referenced by a relationship id."""
         rel = self._relationships.find(part_name, r_id)
         if rel is None or rel.is_external:
             return None
-        
-        # Try to get from media catalog first
-        asset = self._media_catalog.get_by_id(r_id)
-        if asset:
-            return asset.binary_data
-        
-        # Fallback to legacy lookup
-        target = rel.resolved_target or rel.target
-        asset = self._media_catalog.get_by_target(target)
-        return asset.binary_data if asset else None
+
+        # Bytes are read from the package on first use and shared by every
+        # drawing (and catalog asset) that points at the same target.
+        return self._parts(rel.resolved_target or rel.target)
 
 
-def extract_media_from_package(package: DocxPackage, relationships: Relationships) -> MediaCatalog:
+def extract_media_from_package(
+    package: DocxPackage, relationships: Relationships, parts: Optional[MediaParts] = None
+) -> MediaCatalog:
     """Convenience function to extract media catalog from DOCX package."""
-    extractor = MediaExtractor(package, relationships)
+    extractor = MediaExtractor(package, relationships, parts)
     return extractor.extract_media_catalog()
@@ -1,9 +1,7 @@
 """Parse numbering.xml into numbering model definitions."""
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Dict, Optional
-from xml.etree import ElementTree as ET
 
 from docx_renderer.model.numbering_model import (
     AbstractNumberingDefinition,
@@ -12,7 +10,7 @@ from docx_renderer.model.numbering_model import (
     NumberingLevel,
     NumberingOverride,
 )
-from docx_renderer.utils.xml_utils import Namespaces
+from docx_renderer.utils.xml_utils import ET, Namespaces, serialize_element
 
 
 class NumberingParser:
@@ -41,7 +39,7 @@ class NumberingParser:
             name = self._get_attr(abstract_el, "w:name", "w:val")
             style_link = self._get_attr(abstract_el, "w:styleLink", "w:val")
             levels = self._parse_levels(abstract_el)
-            raw = self._serialize_node(abstract_el)
+            raw = serialize_element(abstract_el)
             abstracts[abstract_id] = AbstractNumberingDefinition(
                 abstract_num_id=abstract_id,
                 multi_level_type=multi_level_type,
@@ -66,7 +64,7 @@ class NumberingParser:
             is_legal = None
             if is_legal_raw is not None:
                 is_legal = is_legal_raw == "1"
-            raw = self._serialize_node(lvl_el)
+            raw = serialize_element(lvl_el)
             p_pr = self._collect_child_block(lvl_el, "w:pPr")
             r_pr = self._collect_child_block(lvl_el, "w:rPr")
             levels[level_index] = NumberingLevel(
@@ -110,7 +108,7 @@ class NumberingParser:
             if level_index is None:
                 continue
             start_override = self._get_int_attr(override_el, "w:startOverride", "w:val")
-            raw = self._serialize_node(override_el)
+            raw = serialize_element(override_el)
             overrides[level_index] = NumberingOverride(
                 level_index=level_index,
                 start_override=start_override,
@@ -139,19 +137,7 @@ class NumberingParser:
         child = element.find(child_name, Namespaces.WORD)
         if child is None:
             return []
-        return [self._serialize_node(node) for node in list(child)]
-
-    def _serialize_node(self, node: ET.Element) -> Dict[str, object]:
-        data: Dict[str, object] = {
-            "tag": node.tag,
-            "attributes": deepcopy(node.attrib),
-        }
-        if node.text and node.text.strip():
-            data["text"] = node.text
-        children = [self._serialize_node(child) for child in list(node)]
-        if children:
-            data["children"] = children
-        return data
+        return [serialize_element(node) for node in child]
 
     def _qualify(self, attr_name: str) -> str:
         prefix, local = attr_name.split(":", 1)
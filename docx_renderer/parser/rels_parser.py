@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import posixpath
+import sys
 from dataclasses import dataclass
 from pathlib import PurePosixPath
 from typing import Dict, Iterable, List, Mapping, Optional, Tuple
-from xml.etree import ElementTree as ET
 
-from docx_renderer.utils.xml_utils import Namespaces, parse_xml
+from docx_renderer.utils.xml_utils import ET, Namespaces, parse_xml
 
 WORD_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 
@@ -20,7 +20,7 @@ RELTYPE_NUMBERING = f"{WORD_REL_NS}/numbering"
 MAIN_DOCUMENT_PART = "word/document.xml"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Relationship:
     """Represents a single OPC relationship."""
 
@@ -32,7 +32,7 @@ class Relationship:
     resolved_target: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentRelationshipSummary:
     """Categorized relationship buckets for the main document part."""
 
@@ -53,11 +53,12 @@ class Relationships:
     def from_package(cls, parts: Mapping[str, bytes]) -> "Relationships":
         """Collect relationships from all known .rels parts within the package."""
         by_source: Dict[str, Dict[str, Relationship]] = {}
-        for name, payload in parts.items():
+        # Iterate names so lazily read packages only load the .rels parts.
+        for name in parts:
             if not name.endswith(".rels"):
                 continue
             source, base_dir = cls._source_and_base_from_rel_part(name)
-            tree = parse_xml(payload)
+            tree = parse_xml(parts[name], strip_blank_text=True)
             parsed = cls._parse_relationship_part(source, base_dir, tree)
             if parsed:
                 by_source[source] = parsed
@@ -74,6 +75,10 @@ class Relationships:
         rels = self._by_source.get(source, {})
         return dict(rels)
 
+    def for_part(self, part_name: str) -> Mapping[str, Relationship]:
+        """Return the live id-to-relationship mapping for a source part; do not mutate it."""
+        return self._by_source.get(self._normalize_source(part_name), {})
+
     def iter_all(self) -> Iterable[Relationship]:
         """Iterate over all registered relationships."""
         for rels in self._by_source.values():
@@ -107,9 +112,13 @@ class Relationships:
         for rel_el in tree.findall(".//rel:Relationship", Namespaces.RELS):
             r_id = rel_el.attrib["Id"]
             target = rel_el.attrib.get("Target", "")
-            rel_type = rel_el.attrib.get("Type", "")
+            # Types repeat across every relationship and resolved targets are
+            # looked up as part names, so both are interned.
+            rel_type = sys.intern(rel_el.attrib.get("Type", ""))
             is_external = rel_el.attrib.get("TargetMode") == "External"
             resolved_target = cls._resolve_target_path(base_dir, target, is_external)
+            if resolved_target is not None:
+                resolved_target = sys.intern(resolved_target)
             result[r_id] = Relationship(
                 source_part=source_part,
                 r_id=r_id,
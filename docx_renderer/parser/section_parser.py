@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from typing import Dict, List, Optional
-from xml.etree import ElementTree as ET
 
 from docx_renderer.model.elements import (
     BlockElement,
@@ -18,7 +17,7 @@ from docx_renderer.model.numbering_model import NumberingCatalog
 from docx_renderer.model.style_model import StylesCatalog
 from docx_renderer.parser.docx_loader import DocxPackage
 from docx_renderer.utils.logger import get_logger
-from docx_renderer.utils.xml_utils import Namespaces
+from docx_renderer.utils.xml_utils import ET, Namespaces, serialize_element, to_string
 
 LOGGER = get_logger(__name__)
 
@@ -33,14 +32,17 @@ class SectionParser:
 
     def parse_sections(self, blocks: List[BlockElement]) -> DocumentTree:
         """Split blocks into sections based on section breaks and parse section properties."""
-        sections: List[DocumentSection] = []
-        current_blocks: List[BlockElement] = []
-        
         # Get document-level section properties (final sectPr in document.xml)
         doc_tree = self._package.require_document_xml()
         body = doc_tree.getroot().find("w:body", Namespaces.WORD)
         final_sect_pr = body.find("w:sectPr", Namespaces.WORD) if body is not None else None
-        
+        return self.build_sections(blocks, final_sect_pr)
+
+    def build_sections(self, blocks: List[BlockElement], final_sect_pr: Optional[ET.Element]) -> DocumentTree:
+        """Group blocks into sections using an already located final ``w:sectPr``."""
+        sections: List[DocumentSection] = []
+        current_blocks: List[BlockElement] = []
+
         # Process blocks and look for section breaks
         for block in blocks:
             if isinstance(block, ParagraphElement):
@@ -107,7 +109,7 @@ class SectionParser:
         footer_even = self._parse_header_footer_ref(sect_pr, "w:footerReference", "even")
 
         # Serialize raw properties
-        raw_properties = self._serialize_node(sect_pr)
+        raw_properties = serialize_element(sect_pr)
 
         return SectionProperties(
             page_width=page_width,
@@ -154,7 +156,7 @@ class SectionParser:
         blocks = self._parse_header_footer_blocks(header_footer_xml)
         
         # Store raw XML for debugging
-        raw_xml = ET.tostring(header_footer_xml.getroot(), encoding="unicode")
+        raw_xml = to_string(header_footer_xml.getroot())
 
         return HeaderFooterContent(r_id=r_id, blocks=blocks, raw_xml=raw_xml)
 
@@ -163,7 +165,7 @@ class SectionParser:
         blocks: List[BlockElement] = []
         root = xml_tree.getroot()
 
-        for child in list(root):
+        for child in root:
             tag = self._strip_namespace(child.tag)
             if tag == "p":
                 blocks.append(self._parse_paragraph(child))
@@ -222,23 +224,23 @@ class SectionParser:
     # Helper methods for property extraction
     def _extract_paragraph_properties(self, paragraph_el: ET.Element) -> Dict[str, object]:
         ppr = paragraph_el.find("w:pPr", Namespaces.WORD)
-        return self._serialize_node(ppr) if ppr is not None else {}
+        return serialize_element(ppr) if ppr is not None else {}
 
     def _extract_run_properties(self, run_el: ET.Element) -> Dict[str, object]:
         rpr = run_el.find("w:rPr", Namespaces.WORD)
-        return self._serialize_node(rpr) if rpr is not None else {}
+        return serialize_element(rpr) if rpr is not None else {}
 
     def _extract_table_properties(self, table_el: ET.Element) -> Dict[str, object]:
         tbl_pr = table_el.find("w:tblPr", Namespaces.WORD)
-        return self._serialize_node(tbl_pr) if tbl_pr is not None else {}
+        return serialize_element(tbl_pr) if tbl_pr is not None else {}
 
     def _extract_row_properties(self, row_el: ET.Element) -> Dict[str, object]:
         tr_pr = row_el.find("w:trPr", Namespaces.WORD)
-        return self._serialize_node(tr_pr) if tr_pr is not None else {}
+        return serialize_element(tr_pr) if tr_pr is not None else {}
 
     def _extract_cell_properties(self, cell_el: ET.Element) -> Dict[str, object]:
         tc_pr = cell_el.find("w:tcPr", Namespaces.WORD)
-        return self._serialize_node(tc_pr) if tc_pr is not None else {}
+        return serialize_element(tc_pr) if tc_pr is not None else {}
 
     def _get_style_id(self, element: ET.Element) -> Optional[str]:
         ppr = element.find("w:pPr", Namespaces.WORD)
@@ -289,18 +291,6 @@ class SectionParser:
     def _strip_namespace(self, tag: str) -> str:
         return tag.split("}", 1)[-1]
 
-    def _serialize_node(self, node: ET.Element) -> Dict[str, object]:
-        data = {
-            "tag": node.tag,
-            "attributes": dict(node.attrib),
-        }
-        if node.text and node.text.strip():
-            data["text"] = node.text
-        children = [self._serialize_node(child) for child in list(node)]
-        if children:
-            data["children"] = children
-        return data
-
     def _dict_to_element(self, data: Dict[str, object]) -> ET.Element:
         """Convert serialized node back to ET.Element (simplified)."""
         tag = data["tag"]
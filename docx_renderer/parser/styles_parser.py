@@ -1,12 +1,12 @@
 """Extract style definitions from styles.xml and produce a catalog."""
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any, Dict, List, Optional
-from xml.etree import ElementTree as ET
+import sys
+from typing import Any, Dict, List, Mapping, Optional
 
+from docx_renderer.model.elements import frozen_properties
 from docx_renderer.model.style_model import StyleDefinition, StylesCatalog
-from docx_renderer.utils.xml_utils import Namespaces
+from docx_renderer.utils.xml_utils import ET, Namespaces, serialize_element
 
 PropertyNode = Dict[str, Any]
 
@@ -31,16 +31,20 @@ class StylesParser:
             style_id = style_el.attrib.get(self._qualify("w:styleId"))
             if not style_id:
                 continue
+            style_id = sys.intern(style_id)
             style_type = style_el.attrib.get(self._qualify("w:type"), "paragraph")
             name = self._get_attr(style_el, "w:name", "w:val")
             based_on = self._get_attr(style_el, "w:basedOn", "w:val")
+            if based_on is not None:
+                based_on = sys.intern(based_on)
             next_style = self._get_attr(style_el, "w:next", "w:val")
             linked_style = self._get_attr(style_el, "w:link", "w:val")
             aliases = self._get_attr(style_el, "w:alias", "w:val")
             ui_priority = self._get_int_attr(style_el, "w:uiPriority", "w:val")
             is_default = style_el.attrib.get(self._qualify("w:default")) == "1"
             is_primary = style_el.find("w:qFormat", Namespaces.WORD) is not None
-            properties = self._extract_properties(style_el)
+            extracted = self._extract_properties(style_el)
+            properties = frozen_properties(extracted)
             styles[style_id] = StyleDefinition(
                 style_id=style_id,
                 style_type=style_type,
@@ -103,11 +107,11 @@ class StylesParser:
                 return raw_styles[style_id]
             stack.append(style_id)
             style = raw_styles[style_id]
-            merged_props = deepcopy(style.properties)
+            merged_props = style.properties
             parent_style = None
             if style.based_on and style.based_on in raw_styles:
                 parent_style = resolve(style.based_on, stack)
-                merged_props = self._merge_properties(parent_style.properties, merged_props)
+                merged_props = self._merge_properties(parent_style.properties, style.properties)
             resolved_style = StyleDefinition(
                 style_id=style.style_id,
                 style_type=style.style_type,
@@ -131,35 +135,23 @@ class StylesParser:
 
     def _merge_properties(
         self,
-        parent_props: Dict[str, List[PropertyNode]],
-        child_props: Dict[str, List[PropertyNode]],
-    ) -> Dict[str, List[PropertyNode]]:
-        merged = {key: deepcopy(value) for key, value in parent_props.items()}
+        parent_props: Mapping[str, List[PropertyNode]],
+        child_props: Mapping[str, List[PropertyNode]],
+    ) -> Mapping[str, List[PropertyNode]]:
+        # Property nodes are never mutated after parsing, so parent and child
+        # styles share them; only the per-block lists are new.
+        merged = dict(parent_props)
         for block, entries in child_props.items():
             if block in merged:
                 merged[block] = self._merge_property_entries(merged[block], entries)
             else:
-                merged[block] = deepcopy(entries)
-        return merged
+                merged[block] = entries
+        return frozen_properties(merged)
 
     def _merge_property_entries(
         self, parent_entries: List[PropertyNode], child_entries: List[PropertyNode]
     ) -> List[PropertyNode]:
-        merged: List[PropertyNode] = [deepcopy(entry) for entry in parent_entries]
-        merged.extend(deepcopy(entry) for entry in child_entries)
-        return merged
+        return parent_entries + child_entries
 
     def _serialize_property_block(self, element: ET.Element) -> List[PropertyNode]:
-        return [self._serialize_node(child) for child in list(element)]
-
-    def _serialize_node(self, node: ET.Element) -> PropertyNode:
-        data: PropertyNode = {
-            "tag": node.tag,
-            "attributes": {attr: value for attr, value in node.attrib.items()},
-        }
-        if node.text and node.text.strip():
-            data["text"] = node.text
-        children = [self._serialize_node(child) for child in list(node)]
-        if children:
-            data["children"] = children
-        return data
+        return [serialize_element(child) for child in element]
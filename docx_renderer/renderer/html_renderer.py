@@ -21,8 +21,7 @@ class HtmlRenderer:
         self._output_path.write_text(html, encoding="utf-8")
 
     def _build_html(self, boxes: Iterable[LayoutBox]) -> str:
-        elements = [self._box_to_div(box) for box in boxes]
-        body = "\n".join(elements)
+        body = "\n".join(map(self._box_to_div, boxes))
         return f"""<!DOCTYPE html>
 <html lang=\"en\">
 <head>
@@ -40,13 +39,9 @@ class HtmlRenderer:
 """
 
     def _box_to_div(self, box: LayoutBox) -> str:
-        style = {
-            "left": f"{box.x}px",
-            "top": f"{box.y}px",
-            "width": f"{box.width}px",
-            "height": f"{box.height}px",
-        }
-        style.update(style_to_css(box.style))
-        style_str = "; ".join(f"{k}: {v}" for k, v in style.items())
+        style_str = f"left: {box.x}px; top: {box.y}px; width: {box.width}px; height: {box.height}px"
+        css = style_to_css(box.style)
+        if css:
+            style_str += "; " + "; ".join(f"{k}: {v}" for k, v in css.items())
         content = box.content.get("text", box.content.get("repr", ""))
         return f"  <div class=\"docx-box\" style=\"{style_str}\">{content}</div>"
@@ -1,13 +1,19 @@
 """Tests for document parser functionality."""
+import tempfile
 import unittest
+import zipfile
+from pathlib import Path
 from xml.etree import ElementTree as ET
 
+from docx_renderer.model.elements import EMPTY_PROPERTIES
 from docx_renderer.model.numbering_model import NumberingCatalog
 from docx_renderer.model.style_model import StylesCatalog
 from docx_renderer.parser.document_parser import DocumentParser
 from docx_renderer.parser.docx_loader import DocxPackage
 from docx_renderer.parser.rels_parser import Relationships
 
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
 
 class MockDocxPackage:
     """Mock DOCX package for testing."""
@@ -20,6 +26,12 @@ class MockDocxPackage:
     def require_document_xml(self):
         return self.document_xml
 
+    def iter_document_body(self):
+        body = self.document_xml.getroot().find(
+            "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}body"
+        )
+        return iter(body) if body is not None else None
+
 
 class DocumentParserTest(unittest.TestCase):
     """Test document parsing functionality."""
@@ -48,6 +60,8 @@ class DocumentParserTest(unittest.TestCase):
         paragraph = doc_tree.blocks[0]
         self.assertEqual(len(paragraph.runs), 1)
         self.assertEqual(paragraph.runs[0].text, "Hello World")
+        self.assertIs(paragraph.properties, EMPTY_PROPERTIES)
+        self.assertIs(paragraph.runs[0].properties, EMPTY_PROPERTIES)
 
     def test_parse_paragraph_with_formatting(self) -> None:
         xml = """
@@ -74,10 +88,33 @@ class DocumentParserTest(unittest.TestCase):
         
         paragraph = doc_tree.blocks[0]
         self.assertEqual(paragraph.style_id, "Heading1")
+        # A pPr holding only pStyle is not serialized.
+        self.assertIs(paragraph.properties, EMPTY_PROPERTIES)
         self.assertEqual(len(paragraph.runs), 1)
         self.assertEqual(paragraph.runs[0].text, "Formatted Text")
         self.assertIn("children", paragraph.runs[0].properties)
 
+    def test_identical_run_properties_are_shared_and_read_only(self) -> None:
+        xml = """
+        <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+          <w:body>
+            <w:p>
+              <w:r><w:rPr><w:b/></w:rPr><w:t>bold</w:t></w:r>
+              <w:r><w:rPr><w:b/></w:rPr><w:t> again</w:t></w:r>
+              <w:r><w:rPr><w:i/></w:rPr><w:t> italic</w:t></w:r>
+            </w:p>
+          </w:body>
+        </w:document>
+        """
+        doc_tree = DocumentParser(MockDocxPackage(xml), self.styles, self.numbering).parse()
+
+        runs = doc_tree.blocks[0].runs
+        self.assertIs(runs[1].properties, runs[0].properties)
+        self.assertIsNot(runs[2].properties, runs[0].properties)
+        self.assertEqual(len(runs[0].properties["children"]), 1)
+        with self.assertRaises(TypeError):
+            runs[0].properties["children"] = []  # type: ignore[index]
+
     def test_parse_table(self) -> None:
         xml = """
         <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
@@ -120,6 +157,30 @@ class DocumentParserTest(unittest.TestCase):
         self.assertEqual(len(cell1.content), 1)
         self.assertEqual(cell1.content[0].runs[0].text, "Cell 1")
 
+    def test_parse_table_cell_vmerge(self) -> None:
+        xml = """
+        <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+          <w:body>
+            <w:tbl>
+              <w:tr>
+                <w:tc>
+                  <w:tcPr>
+                    <w:vMerge w:val="restart"/>
+                  </w:tcPr>
+                  <w:p><w:r><w:t>Merged</w:t></w:r></w:p>
+                </w:tc>
+              </w:tr>
+            </w:tbl>
+          </w:body>
+        </w:document>
+        """
+        doc_tree = DocumentParser(MockDocxPackage(xml), self.styles, self.numbering).parse()
+
+        cell = doc_tree.blocks[0].rows[0].cells[0]
+        self.assertEqual(cell.content[0].runs[0].text, "Merged")
+        self.assertEqual(cell.properties["vMerge"], cell.properties["children"][0])
+        self.assertEqual(cell.properties["vMerge"]["attributes"], {f"{{{W_NS}}}val": "restart"})
+
     def test_parse_mixed_content(self) -> None:
         xml = """
         <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
@@ -153,10 +214,94 @@ class DocumentParserTest(unittest.TestCase):
         doc_tree = parser.parse()
         
         self.assertEqual(len(doc_tree.blocks), 3)
+        self.assertIs(doc_tree.blocks, doc_tree.blocks)
         self.assertEqual(doc_tree.blocks[0].runs[0].text, "First paragraph")
         self.assertEqual(len(doc_tree.blocks[1].rows), 1)
         self.assertEqual(doc_tree.blocks[2].runs[0].text, "Second paragraph")
 
+    def test_parse_hyperlink_runs(self) -> None:
+        xml = """
+        <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+                    xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+          <w:body>
+            <w:p>
+              <w:hyperlink r:id="rId5" w:anchor="top">
+                <w:r><w:t>Link</w:t></w:r>
+                <w:r><w:t> text</w:t></w:r>
+              </w:hyperlink>
+              <w:r><w:t> plain</w:t></w:r>
+            </w:p>
+          </w:body>
+        </w:document>
+        """
+        package = MockDocxPackage(xml)
+        doc_tree = DocumentParser(package, self.styles, self.numbering).parse()
+
+        runs = doc_tree.blocks[0].runs
+        self.assertEqual([run.text for run in runs], ["Link", " text", " plain"])
+        self.assertEqual([run.hyperlink_id for run in runs], ["rId5", "rId5", None])
+        self.assertEqual(runs[0].hyperlink_anchor, "top")
+        self.assertIsNone(runs[2].hyperlink_anchor)
+
+    def test_parse_streams_document_body(self) -> None:
+        xml = b"""<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+          <w:body>
+            <w:p><w:r><w:t>Streamed</w:t></w:r></w:p>
+            <w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+            <w:sectPr><w:pgSz w:w="12240" w:h="15840"/></w:sectPr>
+          </w:body>
+        </w:document>"""
+        package = DocxPackage(raw_parts={"word/document.xml": xml})
+        package.relationships = Relationships({})
+        doc_tree = DocumentParser(package, self.styles, self.numbering).parse()
+
+        self.assertIsNone(package.document_xml)
+        self.assertEqual(len(doc_tree.blocks), 2)
+        self.assertEqual(doc_tree.blocks[0].runs[0].text, "Streamed")
+        self.assertEqual(doc_tree.blocks[1].rows[0].cells[0].content[0].runs[0].text, "Cell")
+        self.assertEqual(doc_tree.sections[0].properties.page_width, 12240)
+        self.assertIs(package.require_document_xml(), package.document_xml)
+
+    def test_parse_drawing_reads_deferred_media(self) -> None:
+        xml = b"""<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+            xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+            xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+          <w:body>
+            <w:p><w:r><w:drawing><wp:inline>
+              <wp:extent cx="914400" cy="457200"/>
+              <wp:docPr id="1" descr="Logo"/>
+              <a:graphic><a:graphicData><a:blip r:embed="rId7"/></a:graphicData></a:graphic>
+            </wp:inline></w:drawing></w:r></w:p>
+          </w:body>
+        </w:document>"""
+        rels = b"""<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+          <Relationship Id="rId7" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+                        Target="media/image1.png"/>
+        </Relationships>"""
+        image = b"\x89PNG\r\n\x1a\nfake"
+        parts = {
+            "[Content_Types].xml": b"<Types/>",
+            "word/document.xml": xml,
+            "word/styles.xml": f'<w:styles xmlns:w="{W_NS}"/>'.encode(),
+            "word/_rels/document.xml.rels": rels,
+            "word/media/image1.png": image,
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = Path(tmp) / "media.docx"
+            with zipfile.ZipFile(archive, "w") as docx_zip:
+                for name, data in parts.items():
+                    docx_zip.writestr(name, data)
+            with DocxPackage.load(archive) as package:
+                doc_tree = DocumentParser(package, self.styles, self.numbering).parse()
+
+        drawing = doc_tree.blocks[0].runs[0].drawing
+        self.assertIsNotNone(drawing)
+        self.assertEqual(drawing.target, "word/media/image1.png")
+        self.assertEqual((drawing.width_emu, drawing.height_emu), (914400, 457200))
+        self.assertEqual(drawing.description, "Logo")
+        self.assertEqual(drawing.data, image)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
\ No newline at end of file
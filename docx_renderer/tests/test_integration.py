@@ -9,8 +9,11 @@ from unittest.mock import Mock, MagicMock
 from xml.etree.ElementTree import Element, SubElement
 import zipfile
 import io
+import os
+import tempfile
+from pathlib import Path
 
-from main import build_document_model
+from main import _cached_model, build_document_model, build_document_models
 from docx_renderer.parser.docx_loader import DocxPackage
 from docx_renderer.model.document_model import DocumentModel
 
@@ -46,6 +49,226 @@ class IntegrationTest(unittest.TestCase):
             # Restore original method
             DocxPackage.load = original_load
     
+    def test_build_document_models_batch(self):
+        """Batch building returns one model per file, in input order."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [self._write_docx(tmp_dir, f"doc{index}.docx") for index in range(2)]
+
+            serial = build_document_models(paths, max_workers=1)
+            parallel = build_document_models(paths, max_workers=2)
+
+        self.assertEqual(len(parallel), 2)
+        for model in serial + parallel:
+            self.assertIsInstance(model, DocumentModel)
+            self.assertEqual(len(model.layout.boxes), 1)
+
+    def test_cached_model_reuses_pickled_result(self):
+        """A second build of unchanged bytes is served from the model cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._write_docx(tmp_dir, "doc.docx")
+            cache_dir = Path(tmp_dir) / "cache"
+
+            first = _cached_model(path, cache_dir)
+            self.assertEqual(len(list(cache_dir.iterdir())), 1)
+
+            original_load = DocxPackage.load
+            DocxPackage.load = Mock(side_effect=AssertionError("cache miss"))
+            try:
+                second = _cached_model(path, cache_dir)
+            finally:
+                DocxPackage.load = original_load
+
+        self.assertEqual(len(second.layout.boxes), len(first.layout.boxes))
+        self.assertEqual(second.layout.boxes[0].content, first.layout.boxes[0].content)
+
+    def test_cached_model_keyed_by_source_fingerprint(self):
+        """Entries written by different parser/model sources are never reused."""
+        from unittest import mock
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._write_docx(tmp_dir, "doc.docx")
+            cache_dir = Path(tmp_dir) / "cache"
+
+            for fingerprint in ("old", "new"):
+                with mock.patch("main._model_source_fingerprint", return_value=fingerprint):
+                    _cached_model(path, cache_dir)
+            names = sorted(entry.name for entry in cache_dir.iterdir())
+
+        self.assertEqual(len(names), 2)
+        self.assertTrue(names[0].endswith("-new.pkl.gz"))
+        self.assertTrue(names[1].endswith("-old.pkl.gz"))
+
+    def test_cached_model_write_failures_do_not_fail_conversion(self):
+        """A cache entry that cannot be written is skipped and leaves no temp file."""
+        import pickle
+        from unittest import mock
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._write_docx(tmp_dir, "doc.docx")
+            cache_dir = Path(tmp_dir) / "cache"
+
+            with mock.patch("main.os.replace", side_effect=OSError("disk full")):
+                model = _cached_model(path, cache_dir)
+            self.assertEqual(len(model.layout.boxes), 1)
+            self.assertEqual(list(cache_dir.iterdir()), [])
+
+            with mock.patch("pickle.dumps", side_effect=pickle.PicklingError("unpicklable")):
+                model = _cached_model(path, cache_dir)
+            self.assertEqual(len(model.layout.boxes), 1)
+            self.assertEqual(list(cache_dir.iterdir()), [])
+
+    def test_load_keeps_document_part_in_archive(self):
+        """document.xml is streamed from the archive, which closes with the package."""
+        parts = self._create_minimal_docx_structure().raw_parts
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._write_docx(tmp_dir, "doc.docx")
+
+            with DocxPackage.load(path) as package:
+                self.assertNotIn("word/document.xml", package.raw_parts)
+                self.assertTrue(package.has_part("word/document.xml"))
+                self.assertEqual(len(list(package.iter_document_body())), 1)
+
+            # Reading deferred parts after close fails instead of reopening the file.
+            with self.assertRaisesRegex(ValueError, "package is closed"):
+                package.get_part_data("word/document.xml")
+            with self.assertRaises(ValueError):
+                package.raw_parts["word/styles.xml"]
+            with self.assertRaisesRegex(ValueError, "package is closed"):
+                package.iter_document_body()
+            self.assertEqual(set(package.raw_parts), set(parts) - {"word/document.xml"})
+            package.close()
+
+    def test_load_cached_reuses_part_bytes_of_unchanged_file(self):
+        """load_cached shares read-only part bytes; each call gets its own package."""
+        self.addCleanup(DocxPackage.clear_load_cache)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._write_docx(tmp_dir, "doc.docx")
+
+            first = DocxPackage.load_cached(path)
+            again = DocxPackage.load_cached(path)
+            self.assertIsNot(again, first)
+            self.assertIs(again.raw_parts, first.raw_parts)
+            self.assertIsNot(again.require_styles_xml(), first.require_styles_xml())
+            with self.assertRaises(TypeError):
+                first.raw_parts["word/settings.xml"] = b"<settings/>"  # type: ignore[index]
+            self.assertEqual(len(list(first.iter_document_body())), 1)
+
+            with zipfile.ZipFile(path, "a") as archive:
+                archive.writestr("word/settings.xml", b"<settings/>")
+            changed = DocxPackage.load_cached(path)
+            self.assertIsNotNone(changed.settings_xml)
+            self.assertIsNone(again.settings_xml)
+
+            DocxPackage.clear_load_cache()
+            self.assertIsNot(DocxPackage.load_cached(path).raw_parts, changed.raw_parts)
+
+    def test_load_cached_package_survives_file_replacement(self):
+        """A cached package keeps serving the parts it was loaded with."""
+        self.addCleanup(DocxPackage.clear_load_cache)
+        document = self._create_minimal_docx_structure().raw_parts["word/document.xml"]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._write_docx(tmp_dir, "doc.docx", {"word/media/image1.png": b"old image"})
+            replacement = self._write_docx(
+                tmp_dir,
+                "new.docx",
+                {
+                    "word/document.xml": document.replace(b"Hello World", b"Replaced text"),
+                    "word/media/image1.png": b"new image",
+                },
+            )
+
+            package = DocxPackage.load_cached(path)
+            os.replace(replacement, path)
+
+            body = list(package.iter_document_body())
+            self.assertEqual("".join(body[0].itertext()), "Hello World")
+            self.assertEqual(package.get_part_data("word/media/image1.png"), b"old image")
+
+    def test_media_parts_are_read_once_and_only_when_referenced(self):
+        """Drawing bytes are shared with the catalog; unreferenced media is never read."""
+        from unittest import mock
+
+        document = b"""<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+            xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+            xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+          <w:body><w:p><w:r><w:drawing><wp:inline>
+            <wp:extent cx="914400" cy="457200"/>
+            <a:graphic><a:graphicData><a:blip r:embed="rId7"/></a:graphicData></a:graphic>
+          </wp:inline></w:drawing></w:r></w:p></w:body>
+        </w:document>"""
+        image = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+        rels = f"""<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+          <Relationship Id="rId7" Type="{image}" Target="media/image1.png"/>
+          <Relationship Id="rId8" Type="{image}" Target="media/unused.png"/>
+        </Relationships>""".encode()
+        opened = []
+        original_open = zipfile.ZipFile.open
+
+        def counting_open(archive, name, *args, **kwargs):
+            opened.append(getattr(name, "filename", name))
+            return original_open(archive, name, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._write_docx(
+                tmp_dir,
+                "media.docx",
+                {
+                    "word/document.xml": document,
+                    "word/_rels/document.xml.rels": rels,
+                    "word/media/image1.png": b"used image",
+                    "word/media/unused.png": b"unused image",
+                },
+            )
+            with mock.patch.object(zipfile.ZipFile, "open", counting_open):
+                model = build_document_model(path)
+
+        self.assertEqual(opened.count("word/media/image1.png"), 1)
+        self.assertNotIn("word/media/unused.png", opened)
+        self.assertEqual(model.media.get_by_id("rId7").binary_data, b"used image")
+        self.assertEqual(model.media.get_by_id("rId8").size, len(b"unused image"))
+        with self.assertRaisesRegex(ValueError, "package is closed"):
+            model.media.get_by_id("rId8").binary_data
+
+    def test_optional_parts_parse_on_first_access(self):
+        """Parts such as settings.xml are only parsed when something asks for them."""
+        package = self._create_minimal_docx_structure()
+        self.assertNotIn("word/styles.xml", package.xml_cache)
+        self.assertIsNone(package.settings_xml)
+        self.assertIsNotNone(package.content_types_xml)
+        self.assertIs(package.require_styles_xml(), package.xml_cache["word/styles.xml"])
+        self.assertEqual(package.headers, {})
+
+        header = b'<w:hdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
+        grouped = DocxPackage(raw_parts={**package.raw_parts, "word/header1.xml": header, "word/footer1.xml": header})
+        self.assertEqual(list(grouped.headers), ["word/header1.xml"])
+        self.assertEqual(list(grouped.footers), ["word/footer1.xml"])
+        self.assertEqual(grouped.theme_parts, {})
+
+        missing = dict(package.raw_parts)
+        del missing["word/styles.xml"]
+        with self.assertRaises(KeyError):
+            DocxPackage(raw_parts=missing)._initialize_caches()
+
+    def test_debug_dump_writes_model_json(self):
+        """The debug dump serializes a real model, including its style catalog."""
+        import json
+        from docx_renderer.utils.debug import DebugDumper
+
+        original_load = DocxPackage.load
+        DocxPackage.load = lambda path: self._create_minimal_docx_structure()
+        try:
+            model = build_document_model("mock_path.docx")
+        finally:
+            DocxPackage.load = original_load
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            DebugDumper(Path(tmp_dir)).dump(model)
+            payload = json.loads((Path(tmp_dir) / "document_model.json").read_text())
+
+        self.assertEqual(set(payload), {"styles", "layout", "numbering", "media", "metadata"})
+        self.assertEqual(len(payload["layout"]["boxes"]), 1)
+
     def test_parser_components_integration(self):
         """Test that all parser components work together correctly."""
         from docx_renderer.parser.docx_loader import DocxPackage
@@ -102,6 +325,15 @@ class IntegrationTest(unittest.TestCase):
         with self.assertRaises((ValueError, KeyError)):
             malformed_package.require_styles_xml()
     
+    def _write_docx(self, directory, name, extra=None) -> Path:
+        """Write the minimal package, plus or overriding ``extra`` parts, to a .docx file."""
+        parts = {**self._create_minimal_docx_structure().raw_parts, **(extra or {})}
+        path = Path(directory) / name
+        with zipfile.ZipFile(path, "w") as archive:
+            for part_name, data in parts.items():
+                archive.writestr(part_name, data)
+        return path
+
     def _create_minimal_docx_structure(self) -> DocxPackage:
         """Create a minimal DOCX package structure for testing."""
         # Create minimal XML structures
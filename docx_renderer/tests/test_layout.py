@@ -1,6 +1,7 @@
 """Tests covering basic layout calculations."""
 import unittest
 from typing import Optional
+from unittest import mock
 
 from docx_renderer.model.elements import (
     DocumentSection,
@@ -110,6 +111,14 @@ class LayoutCalculatorTest(unittest.TestCase):
         self.assertGreater(len(box.content["lines"]), 1)
         per_line_height = box.height / len(box.content["lines"])
         self.assertGreater(per_line_height, DEFAULT_LINE_HEIGHT_PT - 1)
+        self.assertEqual(" ".join(box.content["lines"]), long_text)
+
+    def test_wrap_text_breaks_on_character_budget(self) -> None:
+        calculator = LayoutCalculator(StylesCatalog({}))
+        # 10pt text is 5pt per character, so a 30pt line holds six characters.
+        self.assertEqual(calculator._wrap_text("ab cd efgh", 30.0, 10.0), ["ab cd", "efgh"])
+        self.assertEqual(calculator._wrap_text("abc de", 30.0, 10.0), ["abc de"])
+        self.assertEqual(calculator._wrap_text("", 30.0, 10.0), [""])
 
     def test_paragraph_indent_applied_from_style(self) -> None:
         paragraph = ParagraphElement(runs=[RunFragment(text="Indented")], style_id="Body", properties={})
@@ -164,6 +173,8 @@ class LayoutCalculatorTest(unittest.TestCase):
 
         layout = LayoutCalculator(catalog).calculate(tree)
         first_box, second_box = layout.boxes
+        # Both paragraphs share one resolved style.
+        self.assertIs(second_box.style, first_box.style)
 
         self.assertGreater(first_box.y - 72.0, 20.0)
         self.assertAlmostEqual(first_box.style["spacing"]["before"], 24.0, places=2)
@@ -171,6 +182,36 @@ class LayoutCalculatorTest(unittest.TestCase):
         self.assertAlmostEqual(first_box.height, 18.0, places=1)
         self.assertAlmostEqual(second_box.y - (first_box.y + first_box.height), 36.0, places=1)
 
+    def test_identical_table_cells_reuse_layout(self) -> None:
+        rows = [
+            TableRow(cells=[TableCell(content=[ParagraphElement(runs=[RunFragment(text="Same")], style_id=None)])])
+            for _ in range(3)
+        ]
+        table = TableElement(rows=rows, style_id=None)
+        section = DocumentSection(blocks=[table], properties=SectionProperties())
+        layout = LayoutCalculator(StylesCatalog({})).calculate(DocumentTree(sections=[section]))
+
+        cells = [row[0] for row in layout.boxes[0].content["cells"]]
+        self.assertIsNot(cells[1]["boxes"][0], cells[0]["boxes"][0])
+        self.assertEqual(cells[1]["boxes"][0], cells[0]["boxes"][0])
+        cells[1]["boxes"][0].y += 10
+        self.assertNotEqual(cells[1]["boxes"][0].y, cells[0]["boxes"][0].y)
+        self.assertIsNot(cells[1], cells[0])
+        self.assertEqual([cell["rowIndex"] for cell in cells], [0, 1, 2])
+        self.assertLess(cells[0]["y"], cells[1]["y"])
+
+    def test_block_subclasses_use_base_handler(self) -> None:
+        class NoteParagraph(ParagraphElement):
+            pass
+
+        note = NoteParagraph(runs=[RunFragment(text="Note")], style_id=None)
+        section = DocumentSection(blocks=[note, object()], properties=SectionProperties())
+        layout = LayoutCalculator(StylesCatalog({})).calculate(DocumentTree(sections=[section]))
+
+        self.assertEqual(layout.boxes[0].element_type, "paragraph")
+        self.assertEqual(layout.boxes[0].content["text"], "Note")
+        self.assertNotEqual(layout.boxes[1].element_type, "paragraph")
+
     def test_basic_table_layout_allocates_rows_and_columns(self) -> None:
         def make_paragraph(text: str) -> ParagraphElement:
             return ParagraphElement(runs=[RunFragment(text=text)], style_id=None, properties={})
@@ -319,6 +360,39 @@ class LayoutCalculatorTest(unittest.TestCase):
         self.assertEqual(table_box.content["cells"][1][0]["columnIndex"], 0)
         self.assertEqual(table_box.content["cells"][1][1]["columnIndex"], 1)
 
+    def test_cell_margins_accept_prefixed_tags(self) -> None:
+        cell_properties = {
+            "children": [
+                {
+                    "tag": "w:tcMar",
+                    "attributes": {},
+                    "children": [{"tag": "w:top", "attributes": {"w:w": "200", "w:type": "dxa"}}],
+                }
+            ]
+        }
+        cell = TableCell(content=[ParagraphElement(runs=[RunFragment(text="A")], style_id=None)], properties=cell_properties)
+        table = TableElement(rows=[TableRow(cells=[cell])], style_id=None)
+        section = DocumentSection(blocks=[table], properties=SectionProperties())
+        layout = LayoutCalculator(StylesCatalog({})).calculate(DocumentTree(sections=[section]))
+
+        padding = layout.boxes[0].content["cells"][0][0]["padding"]
+        self.assertAlmostEqual(padding["top"], 10.0)
+        self.assertAlmostEqual(padding["left"], DEFAULT_TABLE_CELL_PADDING_PT)
+
+    def test_nested_table_paragraphs_measured_once(self) -> None:
+        inner_paragraph = ParagraphElement(runs=[RunFragment(text="Inner")], style_id=None)
+        inner = TableElement(rows=[TableRow(cells=[TableCell(content=[inner_paragraph])])], style_id=None)
+        outer = TableElement(rows=[TableRow(cells=[TableCell(content=[inner])])], style_id=None)
+        section = DocumentSection(blocks=[outer], properties=SectionProperties())
+        calculator = LayoutCalculator(StylesCatalog({}))
+
+        with mock.patch.object(
+            calculator, "_compute_paragraph_min_width", wraps=calculator._compute_paragraph_min_width
+        ) as measure:
+            calculator.calculate(DocumentTree(sections=[section]))
+
+        measure.assert_called_once_with(inner_paragraph)
+
     def test_vertical_merge_combines_rows(self) -> None:
         WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
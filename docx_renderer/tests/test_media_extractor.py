@@ -1,5 +1,6 @@
 """Test cases for media extraction functionality."""
 
+import base64
 import unittest
 from unittest.mock import Mock
 
@@ -39,6 +40,8 @@ class MediaExtractorTest(unittest.TestCase):
         self.assertEqual(asset.target_path, 'media/image1.png')
         self.assertEqual(asset.media_type, 'image/png')
         self.assertEqual(asset.binary_data, image_data)
+        self.assertEqual(asset.base64_data, base64.b64encode(image_data).decode('ascii'))
+        self.assertIs(asset.base64_data, asset.base64_data)
 
     def test_extract_font_assets(self):
         """Test extraction of font assets."""
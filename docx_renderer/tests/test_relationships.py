@@ -53,6 +53,9 @@ class RelationshipsTest(unittest.TestCase):
         self.assertIn("rId1", header_rels)
         self.assertEqual(header_rels["rId1"].resolved_target, "word/media/image2.png")
 
+        self.assertEqual(dict(relationships.for_part("word/header1.xml")), header_rels)
+        self.assertEqual(relationships.for_part("word/missing.xml"), {})
+
         rel = relationships.find("word/_rels/header1.xml.rels", "rId1")
         assert rel is not None
         self.assertEqual(rel.resolved_target, "word/media/image2.png")
@@ -1,4 +1,5 @@
 """Unit tests for style parsing edge cases."""
+import pickle
 import unittest
 from xml.etree import ElementTree as ET
 
@@ -31,6 +32,13 @@ class StylesParserTest(unittest.TestCase):
         tags = [entry["tag"].split("}")[-1] for entry in rpr]
         self.assertIn("b", tags)
         self.assertIn("i", tags)
+        base_rpr = catalog.get("Base").properties["rPr"]
+        self.assertIs(rpr[0], base_rpr[0])
+        with self.assertRaises(TypeError):
+            derived.properties["rPr"] = []  # type: ignore[index]
+
+        restored = pickle.loads(pickle.dumps(catalog))
+        self.assertEqual(dict(restored.get("Derived").properties), dict(derived.properties))
 
     def test_metadata_and_defaults_propagate(self) -> None:
         xml = """
@@ -57,6 +65,9 @@ class StylesParserTest(unittest.TestCase):
         self.assertEqual(derived.ui_priority, 1)
         self.assertEqual(derived.linked_style, "LinkedStyle")
         self.assertEqual(derived.aliases, "AliasOne")
+        self.assertIs(catalog.default_for("character"), catalog.get("CharBase"))
+        self.assertIsNone(catalog.default_for("paragraph"))
+        self.assertEqual([style.style_id for style in catalog.of_type("character")], ["CharBase", "CharDerived"])
 
     def test_table_properties_preserved(self) -> None:
         xml = """
@@ -2,11 +2,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from docx_renderer.model.document_model import DocumentModel
+from docx_renderer.model.style_model import StylesCatalog
+
+try:  # orjson is optional; it walks the model in C and is much faster.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 
 class DebugDumper:
@@ -18,14 +24,23 @@ class DebugDumper:
     def dump(self, model: DocumentModel) -> None:
         """Persist the document model as JSON for offline analysis."""
         self.directory.mkdir(parents=True, exist_ok=True)
-        payload = self._serialize(model)
-        (self.directory / "document_model.json").write_text(json.dumps(payload, indent=2))
-
-    def _serialize(self, value: Any) -> Any:
-        if is_dataclass(value):
-            return {k: self._serialize(v) for k, v in asdict(value).items()}
-        if isinstance(value, dict):
-            return {k: self._serialize(v) for k, v in value.items()}
-        if isinstance(value, (list, tuple)):
-            return [self._serialize(v) for v in value]
-        return value
+        target = self.directory / "document_model.json"
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+            target.write_bytes(orjson.dumps(model, default=_encode_extra, option=options))
+        else:
+            target.write_text(json.dumps(model, default=_encode_extra, indent=2))
+
+
+def _encode_extra(value: Any) -> Any:
+    """Convert values the JSON encoders do not handle natively."""
+    if is_dataclass(value) and not isinstance(value, type):
+        # Private slots hold lazily computed caches; they are not model data.
+        return {f.name: getattr(value, f.name) for f in fields(value) if not f.name.startswith("_")}
+    if isinstance(value, StylesCatalog):
+        return value.all()
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<{len(value)} bytes>"
+    return repr(value)
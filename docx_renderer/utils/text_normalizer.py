@@ -39,6 +39,14 @@ class TextNormalizer:
     
     # Regex for removing control characters (except tabs, newlines, carriage returns)
     CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+
+    # One str.translate table covering SPECIAL_CHARS and CONTROL_CHARS_PATTERN.
+    # No replacement introduces a control character, so a single pass matches
+    # replacing first and stripping afterwards.
+    _TRANSLATION = str.maketrans({
+        **SPECIAL_CHARS,
+        **{chr(code): None for code in (*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), *range(0x7f, 0xa0))},
+    })
     
     def __init__(self, preserve_whitespace: bool = False):
         """Initialize text normalizer.
@@ -54,11 +62,8 @@ class TextNormalizer:
         if not text:
             return text
         
-        # Replace special characters
-        normalized = self._replace_special_chars(text)
-        
-        # Remove control characters
-        normalized = self._remove_control_chars(normalized)
+        # Replace special characters and remove control characters in one pass
+        normalized = text.translate(self._TRANSLATION)
         
         # Normalize whitespace if not preserving it
         if not self.preserve_whitespace:
@@ -96,16 +101,6 @@ class TextNormalizer:
         raw_text = ''.join(text_generator)
         return self.normalize_text(raw_text)
     
-    def _replace_special_chars(self, text: str) -> str:
-        """Replace special Unicode characters with normalized equivalents."""
-        for original, replacement in self.SPECIAL_CHARS.items():
-            text = text.replace(original, replacement)
-        return text
-    
-    def _remove_control_chars(self, text: str) -> str:
-        """Remove control characters that shouldn't appear in document text."""
-        return self.CONTROL_CHARS_PATTERN.sub('', text)
-    
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace to single spaces and trim."""
         # Collapse multiple whitespace characters to single space
@@ -133,17 +128,17 @@ class NamespaceStripper:
         'w16:',   # Word 2016 namespace
     ]
     
+    # Only replace at word boundaries to avoid partial matches
+    _PREFIX_PATTERNS = [re.compile(r'\b' + re.escape(prefix)) for prefix in NAMESPACE_PREFIXES]
+
     def strip_namespaces(self, text: str) -> str:
         """Remove namespace prefixes from element names in text."""
         if not text:
             return text
         
         stripped = text
-        for prefix in self.NAMESPACE_PREFIXES:
-            # Only replace at word boundaries to avoid partial matches
-            import re
-            pattern = r'\b' + re.escape(prefix)
-            stripped = re.sub(pattern, '', stripped)
+        for pattern in self._PREFIX_PATTERNS:
+            stripped = pattern.sub('', stripped)
         
         return stripped
     
@@ -1,40 +1,194 @@
 """Helper functions to work with XML namespaces and parsing."""
 from __future__ import annotations
 
+import io
+import sys
+import threading
 from dataclasses import dataclass
-from typing import Dict, Optional
-from xml.etree import ElementTree as ET
+from types import MappingProxyType
+from typing import BinaryIO, Callable, Dict, Hashable, Iterator, Mapping, Optional, Tuple, Union
+from xml.etree import ElementTree as _StdET
+
+try:  # lxml is optional; it parses large parts several times faster.
+    from lxml import etree as ET
+
+    HAS_LXML = True
+except ImportError:  # pragma: no cover - depends on the environment
+    ET = _StdET  # type: ignore[misc]
+    HAS_LXML = False
 
 
 @dataclass(frozen=True)
 class Namespaces:
     """Common OpenXML namespace prefixes used across parsers."""
 
-    WORD: Dict[str, str] = None  # type: ignore[assignment]
-    RELS: Dict[str, str] = None  # type: ignore[assignment]
-    DRAWING: Dict[str, str] = None  # type: ignore[assignment]
+    WORD: Mapping[str, str] = None  # type: ignore[assignment]
+    RELS: Mapping[str, str] = None  # type: ignore[assignment]
+    DRAWING: Mapping[str, str] = None  # type: ignore[assignment]
 
     def __post_init__(self) -> None:  # pragma: no cover
         raise RuntimeError("Namespaces should not be instantiated")
 
 
-Namespaces.WORD = {  # type: ignore[attr-defined]
+# Read-only so the prefix maps can be shared by every find() call safely.
+Namespaces.WORD = MappingProxyType({  # type: ignore[attr-defined]
     "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
-}
-Namespaces.RELS = {  # type: ignore[attr-defined]
+})
+Namespaces.RELS = MappingProxyType({  # type: ignore[attr-defined]
     "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
-}
-Namespaces.DRAWING = {  # type: ignore[attr-defined]
+})
+Namespaces.DRAWING = MappingProxyType({  # type: ignore[attr-defined]
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
     "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
-}
+})
+
+
+_PARSERS = threading.local()
+
+# Options shared by the tree and streaming lxml parsers. Comments and
+# processing instructions are dropped so every child exposes a string tag,
+# matching what the stdlib parser produces. DOCX parts never rely on
+# xml:id lookups or entity expansion, and must not reach the network.
+# Blank text is kept: whitespace inside <w:t xml:space="preserve"> matters.
+_LXML_OPTIONS = MappingProxyType(
+    {
+        "huge_tree": True,
+        "collect_ids": False,
+        "resolve_entities": False,
+        "no_network": True,
+        "remove_comments": True,
+        "remove_pis": True,
+    }
+)
+
+
+def _lxml_parser(strip_blank_text: bool = False) -> "ET.XMLParser":
+    # lxml parser objects must not be shared between threads, so each thread
+    # that parses parts gets its own.
+    attr = "compact_parser" if strip_blank_text else "parser"
+    parser = getattr(_PARSERS, attr, None)
+    if parser is None:
+        parser = ET.XMLParser(remove_blank_text=strip_blank_text, **_LXML_OPTIONS)
+        setattr(_PARSERS, attr, parser)
+    return parser
+
 
+def parse_xml(data: bytes, *, strip_blank_text: bool = False) -> ET.ElementTree:
+    """Parse XML from raw bytes with sane defaults. Safe to call from several threads.
 
-def parse_xml(data: bytes) -> ET.ElementTree:
-    """Parse XML from raw bytes with sane defaults."""
+    ``strip_blank_text`` drops indentation between elements. Only use it for
+    structural parts (styles, numbering, relationships) whose text content is
+    never significant; the stdlib backend ignores it.
+    """
+    if HAS_LXML:
+        return ET.ElementTree(ET.fromstring(data, _lxml_parser(strip_blank_text)))
     return ET.ElementTree(ET.fromstring(data))
 
 
+def iter_child_elements(source: Union[bytes, BinaryIO], parent_tag: str) -> Optional[Iterator[ET.Element]]:
+    """Stream the direct children of the first ``parent_tag`` element.
+
+    ``source`` is raw bytes or a binary stream; a stream is closed once the
+    children are exhausted. Returns ``None`` when the element does not occur.
+    Each child is yielded once fully parsed and detached afterwards, so only
+    the element being consumed stays in memory.
+    """
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    if HAS_LXML:
+        events = ET.iterparse(stream, events=("start", "end"), **_LXML_OPTIONS)
+    else:
+        events = ET.iterparse(stream, events=("start", "end"))
+    try:
+        for event, element in events:
+            if event == "start" and element.tag == parent_tag:
+                return _drain_children(events, element, stream)
+    except BaseException:
+        stream.close()
+        raise
+    stream.close()
+    return None
+
+
+def _drain_children(
+    events: Iterator[Tuple[str, ET.Element]], parent: ET.Element, stream: BinaryIO
+) -> Iterator[ET.Element]:
+    depth = 0
+    try:
+        for event, element in events:
+            if event == "start":
+                depth += 1
+                continue
+            if depth == 0:
+                return
+            depth -= 1
+            if depth == 0:
+                yield element
+                parent.remove(element)
+    finally:
+        stream.close()
+
+
+def compile_find(path: str, namespaces: Mapping[str, str]) -> Callable[[ET.Element], Optional[ET.Element]]:
+    """Return a function that finds the first match of ``path`` under an element.
+
+    With lxml the path is compiled once into an ``XPath`` object; elements from
+    the stdlib backend fall back to ``Element.find``.
+    """
+    namespaces = dict(namespaces)
+    if not HAS_LXML:
+        return lambda element: element.find(path, namespaces)
+
+    xpath = ET.XPath(path, namespaces=namespaces)
+
+    def find(element: ET.Element) -> Optional[ET.Element]:
+        if not isinstance(element, ET._Element):
+            return element.find(path, namespaces)
+        matches = xpath(element)
+        return matches[0] if matches else None
+
+    return find
+
+
+def serialize_element(node: ET.Element) -> Dict[str, object]:
+    """Convert an element subtree into nested ``tag``/``attributes``/``children`` dicts.
+
+    Tag and attribute names are interned since the same few hundred repeat
+    across a document; leaf nodes get no ``children`` key.
+    """
+    data: Dict[str, object] = {
+        "tag": sys.intern(node.tag),
+        "attributes": {sys.intern(key): value for key, value in node.attrib.items()},
+    }
+    text = node.text
+    if text and text.strip():
+        data["text"] = text
+    if len(node):
+        data["children"] = [serialize_element(child) for child in node]
+    return data
+
+
+def element_key(element: ET.Element) -> Hashable:
+    """Return a hashable key that is equal for structurally identical subtrees.
+
+    lxml serializes in C, which is cheaper than walking the tree in Python;
+    the stdlib backend builds a nested tuple instead. Tails are ignored.
+    """
+    if HAS_LXML and isinstance(element, ET._Element):
+        return ET.tostring(element, with_tail=False)
+    return _tuple_key(element)
+
+
+def _tuple_key(element: ET.Element) -> Tuple[object, ...]:
+    return (element.tag, tuple(element.attrib.items()), element.text, tuple(map(_tuple_key, element)))
+
+
+def to_string(element: ET.Element) -> str:
+    """Serialize an element from either backend to a unicode string."""
+    if HAS_LXML and isinstance(element, ET._Element):
+        return ET.tostring(element, encoding="unicode")
+    return _StdET.tostring(element, encoding="unicode")
+
+
 def find_text(element: ET.Element, xpath: str, namespaces: Optional[Dict[str, str]] = None) -> Optional[str]:
     """Return trimmed text from the first element that matches the xpath."""
     found = element.find(xpath, namespaces or {})
@@ -1,16 +1,18 @@
 """Entry-point for the docx renderer pipeline."""
 from __future__ import annotations
 
+import contextlib
+import functools
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from docx_renderer.model.document_model import DocumentModel
 from docx_renderer.parser.docx_loader import DocxPackage
 from docx_renderer.parser.document_parser import DocumentParser
 from docx_renderer.parser.layout_calculator import LayoutCalculator
-from docx_renderer.parser.media_extractor import extract_media_from_package
+from docx_renderer.parser.media_extractor import MediaParts, extract_media_from_package
 from docx_renderer.parser.numbering_parser import NumberingParser
-from docx_renderer.parser.rels_parser import Relationships
 from docx_renderer.parser.styles_parser import StylesParser
 from docx_renderer.renderer.html_renderer import HtmlRenderer
 from docx_renderer.renderer.pdf_renderer import PdfRenderer
@@ -19,45 +21,142 @@ from docx_renderer.utils.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+MODEL_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "docx_renderer"
+# Packages whose source decides what a pickled model contains.
+MODEL_SOURCE_PACKAGES = ("model", "parser", "utils")
+
 
 def build_document_model(docx_path: Path) -> DocumentModel:
     """Load a DOCX package, parse WordprocessingML, and build an internal model."""
-    package = DocxPackage.load(docx_path)
-    relationships = Relationships.from_package(package.raw_parts)
-    media_catalog = extract_media_from_package(package, relationships)
-    styles = StylesParser(package.require_styles_xml(), package.get_numbering_xml()).parse()
-    numbering = NumberingParser(package.get_numbering_xml()).parse()
-    document_tree = DocumentParser(package, styles, numbering).parse()
+    with DocxPackage.load(docx_path) as package:
+        # The catalog and the drawing resolver share one read of each media part.
+        media_parts = MediaParts(package)
+        media_catalog = extract_media_from_package(package, package.relationships, media_parts)
+        styles = StylesParser(package.require_styles_xml(), package.get_numbering_xml()).parse()
+        numbering = NumberingParser(package.get_numbering_xml()).parse()
+        document_tree = DocumentParser(package, styles, numbering, media_parts).parse()
     layout_model = LayoutCalculator(styles).calculate(document_tree)
     return DocumentModel(styles=styles, layout=layout_model, numbering=numbering, media=media_catalog)
 
 
+@functools.lru_cache(maxsize=None)
+def _model_source_fingerprint() -> str:
+    """Hash of the model/parser sources, so cached pickles never outlive a code change."""
+    import hashlib
+
+    import docx_renderer
+
+    package_dir = Path(docx_renderer.__file__).resolve().parent
+    digest = hashlib.sha256()
+    for package in MODEL_SOURCE_PACKAGES:
+        for source in sorted((package_dir / package).glob("*.py")):
+            digest.update(source.relative_to(package_dir).as_posix().encode())
+            digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _cached_model(docx_path: Path, cache_dir: Path = MODEL_CACHE_DIR) -> DocumentModel:
+    """Return the model for ``docx_path``, reusing a pickled copy keyed by content hash."""
+    # Imported here so plain conversions do not pay for them at startup.
+    import gzip
+    import hashlib
+    import pickle
+    import tempfile
+
+    digest = hashlib.sha256(docx_path.read_bytes()).hexdigest()[:16]
+    cache_file = cache_dir / f"{digest}-{_model_source_fingerprint()}.pkl.gz"
+    try:
+        model = pickle.loads(gzip.decompress(cache_file.read_bytes()))
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # stale or corrupt entry; rebuild below
+        LOGGER.debug("Ignoring unreadable model cache %s: %s", cache_file, exc)
+    else:
+        LOGGER.debug("Model cache hit for %s", docx_path.name)
+        return model
+
+    model = build_document_model(docx_path)
+    temp_name: Optional[str] = None
+    try:
+        payload = gzip.compress(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL), compresslevel=1)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as handle:
+            temp_name = handle.name
+            handle.write(payload)
+        os.replace(temp_name, cache_file)
+        temp_name = None
+    # The cache is opt-in: failing to store an entry must not fail the
+    # conversion. Unpicklable objects raise TypeError as well as PicklingError.
+    except (OSError, pickle.PicklingError, TypeError) as exc:
+        LOGGER.warning("Could not write model cache %s: %s", cache_file, exc)
+    finally:
+        if temp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+    return model
+
+
+def build_document_models(docx_paths: Iterable[Path], *, max_workers: Optional[int] = None) -> List[DocumentModel]:
+    """Build models for several DOCX files in parallel, one worker process per file.
+
+    Results are returned in input order. A single file, or ``max_workers=1``,
+    is processed in the calling process.
+    """
+    paths = list(docx_paths)
+    if len(paths) < 2 or max_workers == 1:
+        return [build_document_model(path) for path in paths]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(build_document_model, paths))
+
+
 def render_outputs(model: DocumentModel, output_dir: Path, *, html: bool = True, pdf: bool = False) -> None:
     """Render the flattened model into the requested formats."""
     output_dir.mkdir(parents=True, exist_ok=True)
+    renderers = []
     if html:
-        HtmlRenderer(output_dir / "document.html").render(model)
+        renderers.append(HtmlRenderer(output_dir / "document.html"))
     if pdf:
-        PdfRenderer(output_dir / "document.pdf").render(model)
+        renderers.append(PdfRenderer(output_dir / "document.pdf"))
 
+    if len(renderers) < 2:
+        for renderer in renderers:
+            renderer.render(model)
+        return
 
-def main(docx_file: str, output_dir: Optional[str] = None) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Renderers only read the finished model, so they can run side by side.
+    with ThreadPoolExecutor(max_workers=len(renderers)) as executor:
+        for future in [executor.submit(renderer.render, model) for renderer in renderers]:
+            future.result()
+
+
+def main(
+    docx_file: str,
+    output_dir: Optional[str] = None,
+    *,
+    pdf: bool = False,
+    use_cache: bool = False,
+) -> None:
     """Run the DOCX → intermediate model → renderer pipeline."""
-    docx_path = Path(docx_file).resolve()
-    if not docx_path.exists():
-        raise FileNotFoundError(f"DOCX file not found: {docx_path}")
+    # abspath is pure string work; a single stat confirms the input exists.
+    docx_path = Path(os.path.abspath(docx_file))
+    try:
+        os.stat(docx_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"DOCX file not found: {docx_path}") from None
 
     LOGGER.info("Building document model for %s", docx_path.name)
-    model = build_document_model(docx_path)
-
-    if output_dir is None:
-        output_dir = docx_path.with_suffix("")
+    model = _cached_model(docx_path) if use_cache else build_document_model(docx_path)
 
-    output_path = Path(output_dir).resolve()
+    output_path = Path(os.path.abspath(output_dir)) if output_dir is not None else docx_path.with_suffix("")
     LOGGER.info("Rendering outputs into %s", output_path)
-    render_outputs(model, output_path)
+    render_outputs(model, output_path, html=True, pdf=pdf)
 
-    DebugDumper(output_path / "debug").dump(model)
+    if os.environ.get("DEBUG"):
+        DebugDumper(output_path / "debug").dump(model)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -67,8 +166,12 @@ if __name__ == "__main__":  # pragma: no cover
     parser.add_argument("docx_file", help="Path to the input .docx file")
     parser.add_argument("--output", help="Directory to write generated artifacts")
     parser.add_argument("--pdf", action="store_true", help="Generate a PDF output as well as HTML")
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=f"Reuse parsed models cached under {MODEL_CACHE_DIR}",
+    )
 
     args = parser.parse_args()
-    doc_model = build_document_model(Path(args.docx_file))
-    render_outputs(doc_model, Path(args.output or Path(args.docx_file).with_suffix("")), html=True, pdf=args.pdf)
-    DebugDumper(Path(args.output or Path(args.docx_file).with_suffix("")) / "debug").dump(doc_model)
+    main(args.docx_file, args.output, pdf=args.pdf, use_cache=args.cache)